@@ -0,0 +1,76 @@
+"""Замеры памяти для разных представлений сотрудников.
+
+Запуск из папки задания:
+python bench.py [memory|salary]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from main import iter_parsed_employees, minor_units_to_decimal
+from records import get_employee_columns, get_employee_records
+
+EMPLOYEES_COUNT = 200_000
+SALARY_LINES_COUNT = 10_000_000
+POSITIONS = ['developer', 'manager', 'middle_developer', 'senior_developer', 'tester']
+
+
+def make_input_file(path: str, lines_count: int):
+    rnd = random.Random(42)
+    with open(path, 'w') as file:
+        for idx in range(lines_count):
+            file.write(
+                f'id {idx} name Name{idx} last_name LastName{idx} wrong_key wrong_value '
+                f'age {rnd.randint(18, 70)} salary {rnd.randint(10_000, 500_000)} position {rnd.choice(POSITIONS)}\n'
+            )
+
+
+def measure_memory(func) -> int:
+    """Сколько памяти занимает результат func."""
+    tracemalloc.start()
+    result = func()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def bench_memory(path: str):
+    representations = {
+        'dicts': lambda: list(iter_parsed_employees(path)),
+        'slots records': lambda: get_employee_records(path),
+        'columns': lambda: get_employee_columns(path),
+    }
+    for name, func in representations.items():
+        size = measure_memory(func)
+        print(f'{name}: {size / 2 ** 20:.1f} MiB, {size / EMPLOYEES_COUNT:.0f} bytes per employee')
+
+
+def bench_salary(path: str):
+    """Потоковый парсинг и подсчет фонда оплаты труда с Decimal и с целыми минимальными единицами."""
+    results = {}
+    for fixed_point in (False, True):
+        start = time.perf_counter()
+        payroll = sum(employee['salary'] for employee in iter_parsed_employees(path, fixed_point=fixed_point))
+        elapsed = time.perf_counter() - start
+        results[fixed_point] = (elapsed, payroll)
+        print(f'{"fixed point" if fixed_point else "Decimal"}: {elapsed:.2f}s')
+
+    (decimal_time, decimal_payroll), (fixed_time, fixed_payroll) = results[False], results[True]
+    assert minor_units_to_decimal(fixed_payroll) == decimal_payroll
+    print(f'speedup x{decimal_time / fixed_time:.2f}')
+
+
+if __name__ == '__main__':
+    benches = sys.argv[1:] or ['memory', 'salary']
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        input_path = os.path.join(tmp_dir, 'input_data.txt')
+        if 'memory' in benches:
+            make_input_file(input_path, EMPLOYEES_COUNT)
+            bench_memory(input_path)
+        if 'salary' in benches:
+            make_input_file(input_path, SALARY_LINES_COUNT)
+            bench_salary(input_path)
@@ -0,0 +1,96 @@
+"""Индексы по сотрудникам и агрегаты по должностям, которые обновляются при добавлении и удалении записей."""
+import bisect
+import dataclasses
+from decimal import Decimal
+from typing import Iterable
+
+Employee = dict[str, int | str]
+
+
+@dataclasses.dataclass
+class PositionStats:
+    count: int = 0
+    salary_sum: Decimal = Decimal(0)
+    age_sum: int = 0
+    # Отсортированные зарплаты нужны, чтобы min и max оставались верными после удаления записей.
+    sorted_salaries: list[Decimal] = dataclasses.field(default_factory=list, repr=False)
+
+    @property
+    def min_salary(self) -> Decimal:
+        return self.sorted_salaries[0]
+
+    @property
+    def max_salary(self) -> Decimal:
+        return self.sorted_salaries[-1]
+
+    @property
+    def mean_age(self) -> float:
+        return self.age_sum / self.count
+
+    def add(self, employee: Employee):
+        self.count += 1
+        self.salary_sum += employee['salary']
+        self.age_sum += employee['age']
+        bisect.insort(self.sorted_salaries, employee['salary'])
+
+    def remove(self, employee: Employee):
+        self.count -= 1
+        self.salary_sum -= employee['salary']
+        self.age_sum -= employee['age']
+        del self.sorted_salaries[bisect.bisect_left(self.sorted_salaries, employee['salary'])]
+
+
+class EmployeeIndex:
+    """Хранилище сотрудников с поиском по id и фамилии за O(1) и готовыми агрегатами по должностям.
+
+    Принимает записи в формате get_parsed_employees_info.
+    """
+
+    def __init__(self, employees: Iterable[Employee] = ()):
+        self._by_id: dict[int, Employee] = {}
+        self._by_last_name: dict[str, dict[int, Employee]] = {}
+        self._position_stats: dict[str, PositionStats] = {}
+        for employee in employees:
+            self.add(employee)
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, employee_id: int) -> bool:
+        return employee_id in self._by_id
+
+    def add(self, employee: Employee):
+        employee_id = employee['id']
+        if employee_id in self._by_id:
+            raise ValueError(f'сотрудник с id {employee_id} уже есть в индексе')
+
+        self._by_id[employee_id] = employee
+        self._by_last_name.setdefault(employee['last_name'], {})[employee_id] = employee
+        self._position_stats.setdefault(employee['position'], PositionStats()).add(employee)
+
+    def remove(self, employee_id: int) -> Employee:
+        employee = self._by_id.pop(employee_id)
+
+        namesakes = self._by_last_name[employee['last_name']]
+        del namesakes[employee_id]
+        if not namesakes:
+            del self._by_last_name[employee['last_name']]
+
+        stats = self._position_stats[employee['position']]
+        stats.remove(employee)
+        if not stats.count:
+            del self._position_stats[employee['position']]
+
+        return employee
+
+    def get(self, employee_id: int) -> Employee | None:
+        return self._by_id.get(employee_id)
+
+    def find_by_last_name(self, last_name: str) -> list[Employee]:
+        return list(self._by_last_name.get(last_name, {}).values())
+
+    def positions(self) -> list[str]:
+        return list(self._position_stats)
+
+    def position_stats(self, position: str) -> PositionStats | None:
+        return self._position_stats.get(position)
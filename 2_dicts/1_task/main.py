@@ -1,8 +1,11 @@
 import os
 from decimal import Decimal
+from typing import Callable, Iterator
 
 BASE_DIR = os.path.dirname(os.path.dirname(__file__))
 SPLIT_SYMBOL = '\n'
+INPUT_DATA_PATH = os.path.join(BASE_DIR, '1_task', 'input_data.txt')
+SALARY_SCALE = 2
 
 
 def read_file(path: str) -> str:
@@ -13,28 +16,61 @@ def read_file(path: str) -> str:
 
 def get_employees_info() -> list[str]:
     """Внешнее апи, которое возвращает вам список строк с данными по сотрудникам."""
-    return read_file(os.path.join(
-        BASE_DIR, '1_task', 'input_data.txt',
-    )).split(SPLIT_SYMBOL)
+    return read_file(INPUT_DATA_PATH).split(SPLIT_SYMBOL)
+
+
+def parse_minor_units(value: str, scale: int = SALARY_SCALE) -> int:
+    """Переводит десятичную строку в целое число минимальных единиц, например '1234.5' -> 123450 при scale=2.
+
+    Перевод точный: если значащих знаков после точки больше, чем scale, выбрасывается ValueError.
+    """
+    if '.' not in value:
+        return int(value) * 10 ** scale
+
+    integer_part, _, fraction = value.partition('.')
+    if not integer_part.lstrip('+-') and not fraction:
+        raise ValueError(f'в значении {value!r} нет ни одной цифры')
+    # Нули в конце дробной части значения не меняют: '10.500' - это ровно 1050 при scale=2.
+    fraction = fraction.rstrip('0')
+    if len(fraction) > scale or (fraction and not fraction.isdigit()):
+        raise ValueError(f'значение {value!r} нельзя без потерь представить с {scale} знаками после точки')
+    return int(integer_part + fraction.ljust(scale, '0'))
+
+
+def minor_units_to_decimal(units: int, scale: int = SALARY_SCALE) -> Decimal:
+    """Обратный перевод в Decimal, не зависит от точности контекста decimal."""
+    sign, digits, exponent = Decimal(units).as_tuple()
+    return Decimal((sign, digits, exponent - scale))
+
+
+def parse_employee(line: str, parse_salary: Callable[[str], Decimal | int] = Decimal) -> dict[str, int | str]:
+    """Парсит строку с данными одного сотрудника."""
+    words = line.split()
+    employee_data = {}
+    for i in range(0, len(words), 2):
+        key = words[i]
+        value = words[i + 1]
+        if key in ['id', 'age']:
+            employee_data[key] = int(value)
+        elif key == 'salary':
+            employee_data[key] = parse_salary(value)
+        elif key in ['name', 'last_name', 'position']:
+            employee_data[key] = value
+    return employee_data
+
+
+def iter_parsed_employees(path: str = INPUT_DATA_PATH, fixed_point: bool = False) -> Iterator[dict[str, int | str]]:
+    """Лениво читает файл построчно и отдает сотрудников по одному, пустые строки пропускаются.
+
+    При fixed_point=True зарплата - это int в минимальных единицах (см. parse_minor_units), а не Decimal.
+    """
+    parse_salary = parse_minor_units if fixed_point else Decimal
+    with open(path, 'r') as file:
+        for line in file:
+            if line.strip():
+                yield parse_employee(line, parse_salary)
 
 
 def get_parsed_employees_info() -> list[dict[str, int | str]]:
     """Функция парсит данные, полученные из внешнего API и приводит их к стандартизированному виду."""
-    employees_info = get_employees_info()
-    parsed_employees_info = []
-
-    for line in employees_info:
-        words = line.split()
-        employee_data = {}
-        for i in range(0, len(words), 2):
-            key = words[i]
-            value = words[i + 1]
-            if key in ['id', 'age']:
-                employee_data[key] = int(value)
-            elif key == 'salary':
-                employee_data[key] = Decimal(value)
-            elif key in ['name', 'last_name', 'position']:
-                employee_data[key] = value
-        parsed_employees_info.append(employee_data)
-
-    return parsed_employees_info
+    return list(iter_parsed_employees())
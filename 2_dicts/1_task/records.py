@@ -0,0 +1,83 @@
+"""Компактные представления сотрудников вместо словаря на каждую запись."""
+import dataclasses
+import sys
+from array import array
+from collections import defaultdict
+from decimal import Decimal
+from typing import Iterable, Iterator
+
+from main import INPUT_DATA_PATH, iter_parsed_employees
+
+
+@dataclasses.dataclass(slots=True)
+class EmployeeRecord:
+    """Сотрудник; поля, которых не было в строке файла, равны None - как отсутствующие ключи словаря."""
+
+    id: int | None = None
+    name: str | None = None
+    last_name: str | None = None
+    age: int | None = None
+    position: str | None = None
+    salary: Decimal | None = None
+
+REQUIRED_FIELDS = tuple(field.name for field in dataclasses.fields(EmployeeRecord))
+
+
+@dataclasses.dataclass
+class EmployeeColumns:
+    """Колоночное хранение: числа в array, повторяющиеся строки должностей интернированы.
+
+    В отличие от словарей и EmployeeRecord, все поля обязательны: пропусков в array не бывает,
+    поэтому сотрудник без какого-либо поля не добавляется, а выбрасывается ValueError.
+    """
+
+    ids: array = dataclasses.field(default_factory=lambda: array('q'))
+    ages: array = dataclasses.field(default_factory=lambda: array('q'))
+    names: list[str] = dataclasses.field(default_factory=list)
+    last_names: list[str] = dataclasses.field(default_factory=list)
+    positions: list[str] = dataclasses.field(default_factory=list)
+    salaries: list[Decimal] = dataclasses.field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def append(self, employee: dict[str, int | str]):
+        missing = [field for field in REQUIRED_FIELDS if field not in employee]
+        if missing:
+            raise ValueError(f'у сотрудника {employee} нет полей: {", ".join(missing)}')
+
+        self.ids.append(employee['id'])
+        self.ages.append(employee['age'])
+        self.names.append(employee['name'])
+        self.last_names.append(employee['last_name'])
+        self.positions.append(sys.intern(employee['position']))
+        self.salaries.append(employee['salary'])
+
+    @classmethod
+    def from_employees(cls, employees: Iterable[dict[str, int | str]]) -> 'EmployeeColumns':
+        columns = cls()
+        for employee in employees:
+            columns.append(employee)
+        return columns
+
+    def payroll_by_position(self) -> dict[str, Decimal]:
+        """Сумма зарплат по должностям, считается прямо по колонкам."""
+        payroll = defaultdict(Decimal)
+        for position, salary in zip(self.positions, self.salaries):
+            payroll[position] += salary
+        return dict(payroll)
+
+
+def iter_employee_records(path: str = INPUT_DATA_PATH) -> Iterator[EmployeeRecord]:
+    for employee in iter_parsed_employees(path):
+        yield EmployeeRecord(**employee)
+
+
+def get_employee_records(path: str = INPUT_DATA_PATH) -> list[EmployeeRecord]:
+    """То же, что get_parsed_employees_info, но каждая запись - объект со __slots__."""
+    return list(iter_employee_records(path))
+
+
+def get_employee_columns(path: str = INPUT_DATA_PATH) -> EmployeeColumns:
+    """То же, что get_parsed_employees_info, но в колоночном виде."""
+    return EmployeeColumns.from_employees(iter_parsed_employees(path))
@@ -1,7 +1,15 @@
 from decimal import Decimal
 
-from main import get_parsed_employees_info
+import pytest
+from employee_index import EmployeeIndex
+from main import (
+    get_parsed_employees_info,
+    iter_parsed_employees,
+    minor_units_to_decimal,
+    parse_minor_units,
+)
 from pydantic import BaseModel, ValidationError
+from records import EmployeeRecord, get_employee_columns, get_employee_records
 
 
 class EmployeeInfo(BaseModel, extra='forbid'):
@@ -31,3 +39,101 @@ def test_get_parsed_employees_info():
         ListOfEmployeeInfo.model_validate(employees_info, strict=True)
     except ValidationError as e:
         assert False, str(e.errors())
+
+
+def test_iter_parsed_employees_skips_blank_lines(tmp_path):
+    path = tmp_path / 'input_data.txt'
+    path.write_text('id 1 name Ivan wrong_key x salary 10.5\n\nid 2 age 30\n\n\n')
+
+    employees = iter_parsed_employees(str(path))
+
+    assert next(employees) == {'id': 1, 'name': 'Ivan', 'salary': Decimal('10.5')}
+    assert list(employees) == [{'id': 2, 'age': 30}]
+
+
+def test_compact_representations_match_dicts():
+    parsed_info = get_parsed_employees_info()
+    records = get_employee_records()
+    columns = get_employee_columns()
+
+    assert records == [EmployeeRecord(**employee) for employee in parsed_info]
+    assert len(columns) == len(parsed_info)
+    assert list(columns.ids) == [employee['id'] for employee in parsed_info]
+    assert columns.salaries == [employee['salary'] for employee in parsed_info]
+
+    payroll = {}
+    for employee in parsed_info:
+        payroll[employee['position']] = payroll.get(employee['position'], 0) + employee['salary']
+    assert columns.payroll_by_position() == payroll
+
+
+def test_compact_representations_with_missing_fields(tmp_path):
+    path = tmp_path / 'input_data.txt'
+    path.write_text('id 2 age 30\n')
+
+    assert get_employee_records(str(path)) == [EmployeeRecord(id=2, age=30)]
+    assert get_employee_records(str(path))[0].name is None
+    with pytest.raises(ValueError, match='name'):
+        get_employee_columns(str(path))
+
+
+def test_employee_index():
+    parsed_info = get_parsed_employees_info()
+    index = EmployeeIndex(parsed_info)
+    employee = parsed_info[0]
+    position = employee['position']
+    same_position = [item for item in parsed_info if item['position'] == position]
+
+    assert len(index) == len(parsed_info)
+    assert index.get(employee['id']) == employee
+    assert employee in index.find_by_last_name(employee['last_name'])
+
+    stats = index.position_stats(position)
+    assert stats.count == len(same_position)
+    assert stats.salary_sum == sum(item['salary'] for item in same_position)
+    assert stats.max_salary == max(item['salary'] for item in same_position)
+    assert stats.mean_age == sum(item['age'] for item in same_position) / len(same_position)
+
+    assert index.remove(employee['id']) == employee
+    assert employee['id'] not in index
+    assert employee not in index.find_by_last_name(employee['last_name'])
+    rest = same_position[1:]
+    if rest:
+        assert index.position_stats(position).min_salary == min(item['salary'] for item in rest)
+    else:
+        assert index.position_stats(position) is None
+
+    index.add(employee)
+    with pytest.raises(ValueError):
+        index.add(employee)
+
+
+@pytest.mark.parametrize(
+    'value, units',
+    [
+        ('50000', 5000000),
+        ('10.5', 1050),
+        ('10.500', 1050),
+        ('7.000', 700),
+        ('-0.01', -1),
+        ('.75', 75),
+        ('123456789012345678901234567890.99', 12345678901234567890123456789099),
+    ]
+)
+def test_parse_minor_units_round_trip(value, units):
+    assert parse_minor_units(value) == units
+    assert minor_units_to_decimal(units) == Decimal(value)
+
+
+@pytest.mark.parametrize('value', ['1.001', '1.0010', '1e3', '1.x', 'abc', '.', '-.'])
+def test_parse_minor_units_lossy_value(value):
+    with pytest.raises(ValueError):
+        parse_minor_units(value)
+
+
+def test_iter_parsed_employees_fixed_point():
+    employees = list(iter_parsed_employees(fixed_point=True))
+    assert [minor_units_to_decimal(employee['salary']) for employee in employees] == [
+        employee['salary'] for employee in get_parsed_employees_info()
+    ]
+    assert all(type(employee['salary']) is int for employee in employees)
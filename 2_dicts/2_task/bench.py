@@ -0,0 +1,71 @@
+"""Замеры производительности подсчета слов.
+
+Запуск из папки задания:
+python bench.py [parallel|top_k]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import Counter
+
+from main import most_common_words, top_10_most_common_words_from_file
+from parallel import top_10_most_common_words_parallel
+
+WORDS_IN_FILE = 5_000_000
+VOCABULARY_SIZES = (10 ** 5, 10 ** 6, 10 ** 7)
+
+
+def make_text_file(path: str, words_count: int, vocabulary_size: int = 50_000):
+    rnd = random.Random(42)
+    vocabulary = [f'слово{i}' for i in range(vocabulary_size)]
+    with open(path, 'w', encoding='utf-8') as file:
+        for _ in range(words_count // 1000):
+            file.write(', '.join(rnd.choices(vocabulary, k=1000)))
+            file.write('.\n')
+
+
+def measure(func, *args) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def bench_parallel(path: str):
+    single_time, expected = measure(top_10_most_common_words_from_file, path)
+    print(f'single process: {single_time:.2f}s')
+    for workers in sorted({1, 2, 4, os.cpu_count() or 1}):
+        parallel_time, result = measure(top_10_most_common_words_parallel, path, workers)
+        assert result == expected
+        print(f'{workers} workers: {parallel_time:.2f}s, speedup x{single_time / parallel_time:.2f}')
+
+
+def sorted_most_common_words(word_counts: Counter, k: int) -> dict[str, int]:
+    """Прежняя реализация выбора через полную сортировку - для сравнения."""
+    return dict(sorted(word_counts.items(), key=lambda item: (-item[1], item[0]))[:k])
+
+
+def bench_top_k():
+    rnd = random.Random(42)
+    for vocabulary_size in VOCABULARY_SIZES:
+        word_counts = Counter({f'слово{i}': rnd.randint(1, 1000) for i in range(vocabulary_size)})
+        sorted_time, expected = measure(sorted_most_common_words, word_counts, 10)
+        heap_time, result = measure(most_common_words, word_counts, 10)
+        assert result == expected
+        print(
+            f'V={vocabulary_size}: sorted {sorted_time:.3f}s, heap {heap_time:.3f}s, '
+            f'speedup x{sorted_time / heap_time:.2f}'
+        )
+
+
+if __name__ == '__main__':
+    benches = sys.argv[1:] or ['parallel', 'top_k']
+    if 'parallel' in benches:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            text_path = os.path.join(tmp_dir, 'text.txt')
+            make_text_file(text_path, WORDS_IN_FILE)
+            print(f'file size: {os.path.getsize(text_path) / 2 ** 20:.1f} MiB')
+            bench_parallel(text_path)
+    if 'top_k' in benches:
+        bench_top_k()
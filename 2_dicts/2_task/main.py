@@ -1,16 +1,170 @@
+import bisect
+import heapq
 import re
-from collections import Counter
+import time
+from collections import Counter, deque
+from typing import Iterable, Iterator
+
+PUNCTUATION_RE = re.compile(r'[^\w\s]')
+MIN_WORD_LENGTH = 3
+CHUNK_SIZE = 1024 * 1024
+
+
+def count_words(chunks: Iterable[str]) -> Counter:
+    """Считает слова в тексте, поданном кусками.
+
+    Слово может оказаться разрезанным между соседними кусками, поэтому незавершенный хвост
+    куска переносится в начало следующего. В памяти одновременно держится только текущий кусок
+    и сам Counter.
+    """
+    word_counts = Counter()
+    tail = ''
+
+    for chunk in chunks:
+        cleaned_chunk = tail + PUNCTUATION_RE.sub('', chunk)
+        words = cleaned_chunk.split()
+        tail = words.pop() if words and not cleaned_chunk[-1].isspace() else ''
+        word_counts.update(word for word in map(str.lower, words) if len(word) >= MIN_WORD_LENGTH)
+
+    tail = tail.lower()
+    if len(tail) >= MIN_WORD_LENGTH:
+        word_counts[tail] += 1
+
+    return word_counts
+
+
+def read_chunks(path: str, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """Читает текстовый файл кусками по chunk_size символов."""
+    with open(path, 'r', encoding='utf-8') as file:
+        while chunk := file.read(chunk_size):
+            yield chunk
+
+
+def most_common_words(word_counts: Counter, k: int) -> dict[str, int]:
+    """Выбирает k самых частых слов: по убыванию количества, при равенстве - по алфавиту.
+
+    Вместо полной сортировки словаря используется куча размера k, то есть O(V log k) вместо O(V log V).
+    """
+    return dict(heapq.nsmallest(k, word_counts.items(), key=lambda item: (-item[1], item[0])))
+
+
+def top_k_most_common_words(text: str, k: int) -> dict[str, int]:
+    return most_common_words(count_words((text,)), k)
+
 
 def top_10_most_common_words(text: str) -> dict[str, int]:
+    return top_k_most_common_words(text, 10)
+
+
+def top_10_most_common_words_from_chunks(chunks: Iterable[str]) -> dict[str, int]:
+    """То же, что top_10_most_common_words, но для текста, поданного кусками."""
+    return most_common_words(count_words(chunks), 10)
+
+
+def top_10_most_common_words_from_file(path: str, chunk_size: int = CHUNK_SIZE) -> dict[str, int]:
+    """То же, что top_10_most_common_words, но файл читается потоково и целиком в память не загружается."""
+    return top_10_most_common_words_from_chunks(read_chunks(path, chunk_size))
+
+
+class _WordBucket:
+    """Слова с одинаковым количеством: множество для проверки и куча для выдачи по алфавиту.
+
+    Удаление ленивое: слово убирается только из множества, а устаревшие записи кучи выбрасываются,
+    когда доходят до ее вершины. Если устаревших записей становится больше, чем живых, куча пересобирается.
+    """
+
+    def __init__(self):
+        self.words: set[str] = set()
+        self._heap: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def add(self, word: str):
+        self.words.add(word)
+        heapq.heappush(self._heap, word)
+        self._compact()
+
+    def discard(self, word: str):
+        self.words.discard(word)
+        self._compact()
+
+    def smallest(self, k: int) -> list[str]:
+        """Возвращает k первых по алфавиту слов за O(k log n) плюс выброшенные устаревшие записи."""
+        words = []
+        while self._heap and len(words) < k:
+            word = heapq.heappop(self._heap)
+            # Слово, удаленное и снова добавленное, лежит в куче несколько раз - такие копии идут подряд.
+            if word in self.words and (not words or words[-1] != word):
+                words.append(word)
+        for word in words:
+            heapq.heappush(self._heap, word)
+        return words
+
+    def _compact(self):
+        if len(self._heap) > 2 * len(self.words) + 16:
+            self._heap = list(self.words)
+            heapq.heapify(self._heap)
+
+
+class TopWordsTracker:
+    """Частоты слов в скользящем окне по времени.
+
+    Текст добавляется порциями через add, старые порции вычитаются через expire. Слова разложены по корзинам
+    "количество -> слова", а различные количества хранятся в отсортированном списке. Обновление стоит
+    O(log n) на слово, а top(k) идет от наибольших количеств и берет из каждой корзины только нужные
+    слова, поэтому затрагивает O(k) записей, даже если в корзине миллион слов с одинаковым количеством.
+    Метки времени порций должны идти по неубыванию.
+    """
+
+    def __init__(self):
+        self._word_counts: dict[str, int] = {}
+        self._buckets: dict[int, _WordBucket] = {}
+        self._counts: list[int] = []
+        self._batches: deque[tuple[float, Counter]] = deque()
+
+    def add(self, text: str, timestamp: float | None = None):
+        if timestamp is None:
+            timestamp = time.monotonic()
+        batch = count_words((text,))
+        self._batches.append((timestamp, batch))
+        for word, count in batch.items():
+            self._change_count(word, count)
 
-    cleaned_text = re.sub(r'[^\w\s]', '', text).lower()
+    def expire(self, older_than: float):
+        """Убирает из окна все порции, добавленные раньше older_than."""
+        while self._batches and self._batches[0][0] < older_than:
+            _, batch = self._batches.popleft()
+            for word, count in batch.items():
+                self._change_count(word, -count)
 
-    words = cleaned_text.split()
-    
-    word_counts = Counter(word for word in words if len(word) >= 3)
+    def top(self, k: int = 10) -> dict[str, int]:
+        """Возвращает k самых частых слов окна в том же порядке, что и top_k_most_common_words."""
+        most_common = {}
+        for count in reversed(self._counts):
+            if len(most_common) >= k:
+                break
+            for word in self._buckets[count].smallest(k - len(most_common)):
+                most_common[word] = count
+        return most_common
 
-    sorted_word_counts = sorted(word_counts.items(), key=lambda item: (-item[1], item[0]))
+    def _change_count(self, word: str, delta: int):
+        old_count = self._word_counts.get(word, 0)
+        new_count = old_count + delta
 
-    most_common = dict(sorted_word_counts[:10])
+        if old_count:
+            bucket = self._buckets[old_count]
+            bucket.discard(word)
+            if not bucket:
+                del self._buckets[old_count]
+                del self._counts[bisect.bisect_left(self._counts, old_count)]
 
-    return most_common
\ No newline at end of file
+        if new_count:
+            self._word_counts[word] = new_count
+            bucket = self._buckets.get(new_count)
+            if bucket is None:
+                bucket = self._buckets[new_count] = _WordBucket()
+                bisect.insort(self._counts, new_count)
+            bucket.add(word)
+        else:
+            del self._word_counts[word]
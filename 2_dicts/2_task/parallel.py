@@ -0,0 +1,74 @@
+import codecs
+import os
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import pairwise
+
+from main import CHUNK_SIZE, count_words, most_common_words
+
+# Байтовые пробельные символы из ASCII никогда не встречаются внутри многобайтовых последовательностей UTF-8,
+# поэтому резать файл по ним безопасно и для слов, и для кодировки.
+WHITESPACE_BYTES_RE = re.compile(rb'\s')
+
+
+def _align_to_whitespace(file, offset: int, size: int) -> int:
+    """Сдвигает offset вперед до ближайшего пробельного байта (или до конца файла)."""
+    file.seek(offset)
+    while offset < size:
+        block = file.read(CHUNK_SIZE)
+        match = WHITESPACE_BYTES_RE.search(block)
+        if match:
+            return offset + match.start()
+        offset += len(block)
+    return size
+
+
+def split_file_ranges(path: str, parts: int) -> list[tuple[int, int]]:
+    """Делит файл на не более чем parts диапазонов байт [start, end), границы которых приходятся на пробелы."""
+    size = os.path.getsize(path)
+    boundaries = [0]
+    with open(path, 'rb') as file:
+        for part in range(1, parts):
+            offset = max(size * part // parts, boundaries[-1])
+            boundaries.append(_align_to_whitespace(file, offset, size))
+    boundaries.append(size)
+    return [(start, end) for start, end in pairwise(boundaries) if start < end]
+
+
+def _read_range(path: str, start: int, end: int, chunk_size: int):
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    with open(path, 'rb') as file:
+        file.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            block = file.read(min(chunk_size, remaining))
+            if not block:
+                break
+            remaining -= len(block)
+            yield decoder.decode(block)
+    yield decoder.decode(b'', final=True)
+
+
+def count_words_in_range(path: str, start: int, end: int, chunk_size: int = CHUNK_SIZE) -> Counter:
+    """Частичный подсчет слов для одного диапазона байт файла."""
+    return count_words(_read_range(path, start, end, chunk_size))
+
+
+def count_words_parallel(path: str, workers: int | None = None, chunk_size: int = CHUNK_SIZE) -> Counter:
+    """Считает слова в файле в пуле процессов и сливает частичные Counter в один."""
+    workers = workers or os.cpu_count() or 1
+    ranges = split_file_ranges(path, workers)
+    word_counts = Counter()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(count_words_in_range, path, start, end, chunk_size) for start, end in ranges]
+        for future in futures:
+            word_counts.update(future.result())
+
+    return word_counts
+
+
+def top_10_most_common_words_parallel(path: str, workers: int | None = None) -> dict[str, int]:
+    """То же, что top_10_most_common_words_from_file, но файл обрабатывается в несколько процессов."""
+    return most_common_words(count_words_parallel(path, workers), 10)
@@ -1,5 +1,16 @@
+import random
+import re
+from collections import Counter
+
 import pytest
-from main import top_10_most_common_words
+from main import (
+    TopWordsTracker,
+    top_k_most_common_words,
+    top_10_most_common_words,
+    top_10_most_common_words_from_chunks,
+    top_10_most_common_words_from_file,
+)
+from parallel import split_file_ranges, top_10_most_common_words_parallel
 
 TEXT_1 = """
 Ты жива еще, моя старушка?
@@ -131,3 +142,96 @@ MOST_COMMON_3 = {'царица': 4, 'была': 3, 'говорит': 3, 'каб
 )
 def test_most_common_words(text, result):
     assert top_10_most_common_words(text) == result
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 7, 64, 100_000])
+@pytest.mark.parametrize(
+    'text, result',
+    [
+        (TEXT_1, MOST_COMMON_1),
+        (TEXT_2, MOST_COMMON_2),
+        (TEXT_3, MOST_COMMON_3),
+    ]
+)
+def test_most_common_words_from_chunks(text, result, chunk_size):
+    chunks = (text[i:i + chunk_size] for i in range(0, len(text), chunk_size))
+    assert top_10_most_common_words_from_chunks(chunks) == result
+
+
+def test_most_common_words_from_file(tmp_path):
+    path = tmp_path / 'text.txt'
+    path.write_text(TEXT_1 * 3, encoding='utf-8')
+    expected = {word: count * 3 for word, count in MOST_COMMON_1.items()}
+    assert top_10_most_common_words_from_file(str(path), chunk_size=5) == expected
+
+
+@pytest.mark.parametrize('workers', [1, 3, 16])
+def test_most_common_words_parallel(tmp_path, workers):
+    path = tmp_path / 'text.txt'
+    path.write_text(TEXT_3 * 5, encoding='utf-8')
+    assert top_10_most_common_words_parallel(str(path), workers) == top_10_most_common_words(TEXT_3 * 5)
+
+
+def test_split_file_ranges_aligned_to_whitespace(tmp_path):
+    path = tmp_path / 'text.txt'
+    path.write_text(TEXT_2, encoding='utf-8')
+    data = path.read_bytes()
+    ranges = split_file_ranges(str(path), 7)
+
+    assert ranges[0][0] == 0 and ranges[-1][1] == len(data)
+    for (_, end), (start, _) in zip(ranges, ranges[1:]):
+        assert end == start
+        assert data[start:start + 1].isspace()
+
+
+TIED_TEXT = 'Бета, альфа! гамма бета альфа дельта ёж дельта эпсилон гамма, ЖУК жук зета эта эта тета'
+
+
+def sorted_top_k(text: str, k: int) -> dict[str, int]:
+    """Прежний подсчет с полной сортировкой - независимый эталон для порядка при равных количествах."""
+    words = re.sub(r'[^\w\s]', '', text).lower().split()
+    word_counts = Counter(word for word in words if len(word) >= 3)
+    return dict(sorted(word_counts.items(), key=lambda item: (-item[1], item[0]))[:k])
+
+
+def test_top_10_keeps_order():
+    assert list(top_k_most_common_words(TEXT_1, 10).items()) == list(MOST_COMMON_1.items())
+
+
+@pytest.mark.parametrize('text', [TIED_TEXT, TEXT_1, TEXT_3])
+@pytest.mark.parametrize('k', [0, 1, 2, 5, 10, 1000])
+def test_top_k_most_common_words(text, k):
+    assert list(top_k_most_common_words(text, k).items()) == list(sorted_top_k(text, k).items())
+
+
+def test_top_words_tracker_window():
+    tracker = TopWordsTracker()
+    tracker.add(TEXT_1, timestamp=1)
+    tracker.add(TEXT_2, timestamp=2)
+    assert tracker.top() == top_10_most_common_words(TEXT_1 + TEXT_2)
+
+    tracker.expire(older_than=2)
+    assert tracker.top() == MOST_COMMON_2
+
+    tracker.add(TEXT_3, timestamp=3)
+    tracker.expire(older_than=3)
+    assert tracker.top() == MOST_COMMON_3
+    assert tracker.top(3) == top_k_most_common_words(TEXT_3, 3)
+
+    tracker.expire(older_than=4)
+    assert tracker.top() == {}
+
+
+def test_top_words_tracker_matches_full_recount():
+    rnd = random.Random(42)
+    vocabulary = [f'слово{i}' for i in range(50)]
+    texts = [' '.join(rnd.choices(vocabulary, k=rnd.randint(1, 30))) for _ in range(200)]
+    tracker = TopWordsTracker()
+    window_size = 5
+
+    for timestamp, text in enumerate(texts):
+        tracker.add(text, timestamp)
+        tracker.expire(older_than=timestamp - window_size + 1)
+        window_text = ' '.join(texts[max(0, timestamp - window_size + 1):timestamp + 1])
+        for k in (1, 10, 100):
+            assert tracker.top(k) == top_k_most_common_words(window_text, k)
@@ -0,0 +1,57 @@
+"""Замеры пропускной способности форматирования телефонов.
+
+Запуск из папки задания:
+python bench.py
+"""
+import random
+import re
+import time
+
+from main import format_phones
+
+PHONES_COUNT = 1_000_000
+
+
+def legacy_format_phone(phone_number: str) -> str:
+    """Прежняя реализация format_phone - для сравнения."""
+    cleaned_phone_number = re.sub(r'\D', '', phone_number)
+    if (
+        re.match(r'^(8|7|9)\d{10}$', cleaned_phone_number)
+        or re.match(r'^\+7\d{10}$', cleaned_phone_number)
+        or re.match(r'^\d{10}$', cleaned_phone_number)
+    ):
+        if cleaned_phone_number.startswith('7') or cleaned_phone_number.startswith('8'):
+            cleaned_phone_number = '8' + cleaned_phone_number[1:]
+        elif cleaned_phone_number.startswith('+7'):
+            cleaned_phone_number = '8' + cleaned_phone_number[2:]
+        elif len(cleaned_phone_number) == 10:
+            cleaned_phone_number = '8' + cleaned_phone_number
+        return (
+            f"8 ({cleaned_phone_number[1:4]}) {cleaned_phone_number[4:7]}-"
+            f"{cleaned_phone_number[7:9]}-{cleaned_phone_number[9:]}"
+        )
+    return cleaned_phone_number
+
+
+def make_phones(count: int) -> list[str]:
+    rnd = random.Random(42)
+    templates = ['8{}', '+7{}', '7{}', '{}', '8 ({}', '#@!(zz{} петрушка']
+    return [
+        rnd.choice(templates).format(f'9{rnd.randrange(10 ** 9):09d}')
+        for _ in range(count)
+    ]
+
+
+def measure(func, phones: list[str]) -> tuple[float, list[str]]:
+    start = time.perf_counter()
+    result = func(phones)
+    return time.perf_counter() - start, result
+
+
+if __name__ == '__main__':
+    phones = make_phones(PHONES_COUNT)
+    legacy_time, expected = measure(lambda items: [legacy_format_phone(item) for item in items], phones)
+    batch_time, result = measure(lambda items: list(format_phones(items)), phones)
+    assert result == expected
+    print(f'legacy format_phone: {PHONES_COUNT / legacy_time:,.0f} phones/s')
+    print(f'format_phones: {PHONES_COUNT / batch_time:,.0f} phones/s, speedup x{legacy_time / batch_time:.2f}')
@@ -1,22 +1,57 @@
+import csv
 import re
+from typing import Iterable, Iterator, TextIO
 
-def format_phone(phone_number: str) -> str:
-   
-    cleaned_phone_number = re.sub(r'\D', '', phone_number)
-
-    # Проверка соответствия одному из допустимых форматов
-    if re.match(r'^(8|7|9)\d{10}$', cleaned_phone_number) or re.match(r'^\+7\d{10}$', cleaned_phone_number) or re.match(r'^\d{10}$', cleaned_phone_number):
-        # Форматирование номера
-        if cleaned_phone_number.startswith('7') or cleaned_phone_number.startswith('8'):
-            cleaned_phone_number = '8' + cleaned_phone_number[1:]
-        elif cleaned_phone_number.startswith('+7'):
-            cleaned_phone_number = '8' + cleaned_phone_number[2:]
-        elif len(cleaned_phone_number) == 10:
-            cleaned_phone_number = '8' + cleaned_phone_number
-
-        formatted_phone_number = f"8 ({cleaned_phone_number[1:4]}) {cleaned_phone_number[4:7]}-{cleaned_phone_number[7:9]}-{cleaned_phone_number[9:]}"
-    else:
+NON_DIGIT_RE = re.compile(r'\D')
+PREFIX_DIGITS = '789'
+SHORT_NUMBER_LENGTH = 10
+FULL_NUMBER_LENGTH = 11
+
+
+def _format_digits(digits: str) -> str:
+    """Форматирует номер, из которого уже удалены все нецифровые символы."""
+    # Допустимые форматы после очистки: 10 цифр или 11 цифр, начинающиеся с 8, 7 или 9.
+    # Формат +7 после очистки превращается в 7 и попадает во второй случай.
+    length = len(digits)
+    if length != SHORT_NUMBER_LENGTH and (length != FULL_NUMBER_LENGTH or digits[0] not in PREFIX_DIGITS):
         # Возврат очищенного номера, если он не соответствует ни одному из допустимых форматов
-        formatted_phone_number = cleaned_phone_number
+        return digits
+
+    if digits[0] in '78':
+        digits = '8' + digits[1:]
+    elif length == SHORT_NUMBER_LENGTH:
+        digits = '8' + digits
+
+    return f"8 ({digits[1:4]}) {digits[4:7]}-{digits[7:9]}-{digits[9:]}"
+
+
+def format_phone(phone_number: str) -> str:
+    return _format_digits(NON_DIGIT_RE.sub('', phone_number))
+
+
+def format_phones(phone_numbers: Iterable[str]) -> Iterator[str]:
+    """Пакетная версия format_phone: лениво форматирует номера по одному."""
+    sub = NON_DIGIT_RE.sub
+    for phone_number in phone_numbers:
+        yield _format_digits(sub('', phone_number))
+
+
+def format_phones_csv(input_file: TextIO, output_file: TextIO, column: str, delimiter: str = ',') -> int:
+    """Построчно переписывает CSV, форматируя номера в колонке column. Возвращает количество строк данных."""
+    reader = csv.reader(input_file, delimiter=delimiter)
+    writer = csv.writer(output_file, delimiter=delimiter)
+
+    header = next(reader, None)
+    if header is None:
+        return 0
+    writer.writerow(header)
+    column_idx = header.index(column)
+
+    sub = NON_DIGIT_RE.sub
+    rows_count = 0
+    for row in reader:
+        row[column_idx] = _format_digits(sub('', row[column_idx]))
+        writer.writerow(row)
+        rows_count += 1
 
-    return formatted_phone_number
+    return rows_count
@@ -0,0 +1,97 @@
+"""Параллельная нормализация телефонов в колонке большого CSV-файла.
+
+Пример запуска из папки задания:
+python pipeline.py input.csv output.csv --column phone --workers 4
+"""
+import argparse
+import csv
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator
+
+from main import format_phones
+
+CHUNK_SIZE = 10_000
+
+
+def _format_chunk(phone_numbers: list[str]) -> list[str]:
+    return list(format_phones(phone_numbers))
+
+
+def _iter_chunks(rows: Iterable[list[str]], chunk_size: int) -> Iterator[list[list[str]]]:
+    rows = iter(rows)
+    while chunk := list(islice(rows, chunk_size)):
+        yield chunk
+
+
+def _write_chunk(writer, column_idx: int, rows: list[list[str]], future: Future):
+    for row, phone_number in zip(rows, future.result()):
+        row[column_idx] = phone_number
+    writer.writerows(rows)
+
+
+def normalize_csv(
+    input_path: str,
+    output_path: str,
+    column: str,
+    workers: int | None = None,
+    chunk_size: int = CHUNK_SIZE,
+    delimiter: str = ',',
+) -> int:
+    """Форматирует номера в колонке column и пишет результат в output_path в исходном порядке строк.
+
+    Файл читается кусками по chunk_size строк, в обработке одновременно находится не более 2 * workers кусков,
+    поэтому память ограничена независимо от размера файла. Возвращает количество строк данных.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = 2 * workers
+    rows_count = 0
+
+    with (
+        open(input_path, 'r', encoding='utf-8', newline='') as input_file,
+        open(output_path, 'w', encoding='utf-8', newline='') as output_file,
+        ProcessPoolExecutor(max_workers=workers) as executor,
+    ):
+        reader = csv.reader(input_file, delimiter=delimiter)
+        writer = csv.writer(output_file, delimiter=delimiter)
+
+        header = next(reader, None)
+        if header is None:
+            return 0
+        writer.writerow(header)
+        column_idx = header.index(column)
+
+        pending = deque()
+        for rows in _iter_chunks(reader, chunk_size):
+            pending.append((rows, executor.submit(_format_chunk, [row[column_idx] for row in rows])))
+            rows_count += len(rows)
+            if len(pending) >= max_in_flight:
+                _write_chunk(writer, column_idx, *pending.popleft())
+        while pending:
+            _write_chunk(writer, column_idx, *pending.popleft())
+
+    return rows_count
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description='Нормализация телефонов в колонке CSV-файла')
+    parser.add_argument('input', help='исходный CSV-файл')
+    parser.add_argument('output', help='куда записать результат')
+    parser.add_argument('--column', required=True, help='название колонки с телефонами')
+    parser.add_argument('--workers', type=int, default=None, help='количество процессов')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help='строк в одном куске')
+    parser.add_argument('--delimiter', default=',', help='разделитель колонок')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    rows_count = normalize_csv(args.input, args.output, args.column, args.workers, args.chunk_size, args.delimiter)
+    elapsed = time.perf_counter() - start
+    print(f'{rows_count} rows in {elapsed:.2f}s ({rows_count / elapsed:,.0f} rows/s)', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
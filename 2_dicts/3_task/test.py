@@ -1,5 +1,8 @@
+import io
+
 import pytest
-from main import format_phone
+from main import format_phone, format_phones, format_phones_csv
+from pipeline import normalize_csv
 
 STANDARD = "8 (901) 123-45-67"
 
@@ -19,3 +22,28 @@ STANDARD = "8 (901) 123-45-67"
 )
 def test_format_phone(input_phone, result_phone):
     assert format_phone(input_phone) == result_phone
+
+
+def test_format_phones():
+    phones = ["89011234567", "+7901-123-45   67", '1-___123-4asdf&*^ 6', '', '8901123456']
+    assert list(format_phones(phones)) == [format_phone(phone) for phone in phones]
+
+
+def test_format_phones_csv():
+    input_file = io.StringIO('name,phone\nIvan,+79011234567\nPetr,"1-___123,4"\n')
+    output_file = io.StringIO()
+
+    assert format_phones_csv(input_file, output_file, 'phone') == 2
+    assert output_file.getvalue().splitlines() == ['name,phone', f'Ivan,{STANDARD}', 'Petr,11234']
+
+
+def test_normalize_csv(tmp_path):
+    input_path = tmp_path / 'input.csv'
+    output_path = tmp_path / 'output.csv'
+    phones = [f'+7 901 123 45 {idx:02d}' for idx in range(25)]
+    input_path.write_text('\n'.join(['id;phone'] + [f'{idx};{phone}' for idx, phone in enumerate(phones)]) + '\n')
+
+    assert normalize_csv(str(input_path), str(output_path), 'phone', workers=2, chunk_size=3, delimiter=';') == 25
+    assert output_path.read_text().splitlines() == ['id;phone'] + [
+        f'{idx};{format_phone(phone)}' for idx, phone in enumerate(phones)
+    ]
@@ -0,0 +1,104 @@
+"""Замеры пропускной способности кодека кнопочного телефона.
+
+Запуск из папки задания:
+python bench.py [codec|predictive]
+"""
+import random
+import sys
+import time
+
+from codec import CODEC, KEYPAD
+from predictive import PredictiveIndex
+
+MESSAGES_COUNT = 200_000
+VOCABULARY_SIZE = 200_000
+
+
+def legacy_encode_text(text: str) -> str | None:
+    """Прежняя реализация: таблица строится на каждый вызов - для сравнения."""
+    keypad = {char: digit * count for digit, chars in KEYPAD.items() for count, char in enumerate(chars, start=1)}
+    result = []
+    for char in text:
+        if char not in keypad:
+            return None
+        result.append(keypad[char])
+    return ' '.join(result)
+
+
+def legacy_decode_numbers(numbers: str) -> str | None:
+    """Прежняя реализация: проверка и перевод двумя проходами - для сравнения."""
+    keypad = {digit: list(chars) for digit, chars in KEYPAD.items()}
+    groups = numbers.split()
+    for group in groups:
+        if not group.isdigit() or len(group) > 6 or len(group) == 0 or len(set(group)) != 1:
+            return None
+    result = []
+    for group in groups:
+        digit, count = group[0], len(group)
+        if digit not in keypad or count > len(keypad[digit]):
+            return None
+        result.append(keypad[digit][count - 1])
+    return ''.join(result)
+
+
+def make_messages(count: int) -> list[str]:
+    rnd = random.Random(42)
+    alphabet = ''.join(KEYPAD.values())
+    return [''.join(rnd.choices(alphabet, k=rnd.randint(20, 160))) for _ in range(count)]
+
+
+def measure(func, items: list[str]) -> tuple[float, list]:
+    start = time.perf_counter()
+    result = func(items)
+    return time.perf_counter() - start, result
+
+
+def report(name: str, legacy_time: float, new_time: float):
+    print(
+        f'{name}: legacy {MESSAGES_COUNT / legacy_time:,.0f} msg/s, '
+        f'codec {MESSAGES_COUNT / new_time:,.0f} msg/s, speedup x{legacy_time / new_time:.2f}'
+    )
+
+
+def bench_codec():
+    messages = make_messages(MESSAGES_COUNT)
+
+    legacy_time, expected = measure(lambda items: [legacy_encode_text(item) for item in items], messages)
+    codec_time, encoded = measure(CODEC.encode_many, messages)
+    assert encoded == expected
+    report('encode', legacy_time, codec_time)
+
+    legacy_time, expected = measure(lambda items: [legacy_decode_numbers(item) for item in items], encoded)
+    codec_time, decoded = measure(CODEC.decode_many, encoded)
+    assert decoded == expected == messages
+    report('decode', legacy_time, codec_time)
+
+
+def bench_predictive():
+    rnd = random.Random(42)
+    letters = ''.join(KEYPAD[digit] for digit in '23456789')
+    words = [''.join(rnd.choices(letters, k=rnd.randint(2, 12))) for _ in range(VOCABULARY_SIZE)]
+
+    start = time.perf_counter()
+    index = PredictiveIndex.from_words(words)
+    print(f'predictive index build: {time.perf_counter() - start:.2f}s for {VOCABULARY_SIZE} words')
+
+    digit_by_char = {char: digit for digit, chars in KEYPAD.items() for char in chars}
+    keystrokes = [
+        ''.join(digit_by_char[char] for char in word[:end])
+        for word in rnd.sample(words, 10_000)
+        for end in range(1, len(word) + 1)
+    ]
+    start = time.perf_counter()
+    for digits in keystrokes:
+        index.lookup(digits)
+    elapsed = time.perf_counter() - start
+    print(f'predictive lookup: {elapsed / len(keystrokes) * 1e6:.2f} us per keystroke')
+
+
+if __name__ == '__main__':
+    benches = sys.argv[1:] or ['codec', 'predictive']
+    if 'codec' in benches:
+        bench_codec()
+    if 'predictive' in benches:
+        bench_predictive()
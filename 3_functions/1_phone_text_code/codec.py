@@ -0,0 +1,132 @@
+"""Кодек кнопочного телефона с заранее построенными таблицами.
+
+Каждый символ набирается нажатием одной кнопки несколько раз подряд: 'п' - это '5555'.
+"""
+from typing import Iterable, Iterator, TextIO
+
+CHUNK_SIZE = 64 * 1024
+KEYPAD = {
+    '1': '.,?!:;',
+    '2': 'абвг',
+    '3': 'дежз',
+    '4': 'ийкл',
+    '5': 'мноп',
+    '6': 'рсту',
+    '7': 'фхцч',
+    '8': 'шщъы',
+    '9': 'ьэюя',
+    '0': ' ',
+}
+
+
+class KeypadError(ValueError):
+    """Текст нельзя набрать на клавиатуре или последовательность цифр нельзя расшифровать."""
+
+
+class KeypadCodec:
+    def __init__(self, keypad: dict[str, str] = KEYPAD):
+        self.decode_table = {
+            digit * count: char
+            for digit, chars in keypad.items()
+            for count, char in enumerate(chars, start=1)
+        }
+        self.encode_table = {char: code for code, char in self.decode_table.items()}
+
+    def encode(self, text: str) -> str | None:
+        # Проверка и перевод за один проход: неизвестный символ просто не найдется в таблице.
+        try:
+            return ' '.join(map(self.encode_table.__getitem__, text))
+        except KeyError:
+            return None
+
+    def decode(self, numbers: str) -> str | None:
+        try:
+            return ''.join(map(self.decode_table.__getitem__, numbers.split()))
+        except KeyError:
+            return None
+
+    def encode_many(self, texts: Iterable[str]) -> list[str | None]:
+        return list(map(self.encode, texts))
+
+    def decode_many(self, numbers: Iterable[str]) -> list[str | None]:
+        return list(map(self.decode, numbers))
+
+
+CODEC = KeypadCodec()
+
+
+class StreamEncoder:
+    """Потоковый кодировщик: текст подается кусками через feed, результат отдается кусками.
+
+    Вместо None, которое возвращает encode, при некорректном символе выбрасывается KeypadError.
+    """
+
+    def __init__(self, codec: KeypadCodec = CODEC):
+        self._encode_table = codec.encode_table
+        self._started = False
+
+    def feed(self, chunk: str) -> str:
+        try:
+            encoded = ' '.join(map(self._encode_table.__getitem__, chunk))
+        except KeyError as e:
+            raise KeypadError(f'символ {e.args[0]!r} нельзя набрать на клавиатуре') from None
+
+        if not encoded:
+            return ''
+        if self._started:
+            encoded = ' ' + encoded
+        self._started = True
+        return encoded
+
+    def finish(self) -> str:
+        return ''
+
+
+class StreamDecoder:
+    """Потоковый декодировщик: группа цифр может оказаться разрезанной между соседними кусками.
+
+    Вместо None, которое возвращает decode, при некорректной группе выбрасывается KeypadError.
+    """
+
+    def __init__(self, codec: KeypadCodec = CODEC):
+        self._decode_table = codec.decode_table
+        self._max_group_length = max(map(len, self._decode_table))
+        self._tail = ''
+
+    def feed(self, chunk: str) -> str:
+        data = self._tail + chunk
+        groups = data.split()
+        self._tail = groups.pop() if groups and not data[-1].isspace() else ''
+        # Незавершенная группа не может быть длиннее самой длинной корректной, иначе память росла бы без предела.
+        if len(self._tail) > self._max_group_length:
+            raise KeypadError(f'группа {self._tail!r} не соответствует ни одному символу')
+        return self._decode(groups)
+
+    def finish(self) -> str:
+        groups = [self._tail] if self._tail else []
+        self._tail = ''
+        return self._decode(groups)
+
+    def _decode(self, groups: list[str]) -> str:
+        try:
+            return ''.join(map(self._decode_table.__getitem__, groups))
+        except KeyError as e:
+            raise KeypadError(f'группа {e.args[0]!r} не соответствует ни одному символу') from None
+
+
+def _iter_stream(coder: StreamEncoder | StreamDecoder, file: TextIO, chunk_size: int) -> Iterator[str]:
+    while chunk := file.read(chunk_size):
+        if result := coder.feed(chunk):
+            yield result
+    if result := coder.finish():
+        yield result
+
+
+def iter_encode(file: TextIO, chunk_size: int = CHUNK_SIZE, codec: KeypadCodec = CODEC) -> Iterator[str]:
+    """Кодирует содержимое файла кусками, не загружая его в память целиком."""
+    return _iter_stream(StreamEncoder(codec), file, chunk_size)
+
+
+def iter_decode(file: TextIO, chunk_size: int = CHUNK_SIZE, codec: KeypadCodec = CODEC) -> Iterator[str]:
+    """Декодирует содержимое файла кусками, не загружая его в память целиком."""
+    return _iter_stream(StreamDecoder(codec), file, chunk_size)
@@ -0,0 +1,54 @@
+"""Предиктивный набор (T9): каждая буква набирается одним нажатием, слово угадывается по словарю.
+
+Например, 'привет' набирается как '564236' вместо '5555 6 4 222 33 666'.
+"""
+import json
+from collections import Counter
+from typing import Iterable
+
+from codec import KEYPAD
+
+
+class PredictiveIndex:
+    """Индекс "префикс цифр -> лучшие слова".
+
+    Это развернутое в словарь префиксное дерево: для каждого узла заранее сохранены max_results самых частых слов
+    (при равной частоте - по алфавиту), поэтому поиск на каждое нажатие - одно обращение к dict.
+    """
+
+    def __init__(self, completions: dict[str, list[str]], max_results: int):
+        self.completions = completions
+        self.max_results = max_results
+
+    @classmethod
+    def from_words(cls, words: Iterable[str], max_results: int = 10, keypad: dict[str, str] = KEYPAD):
+        """Строит индекс по словам; чем чаще слово встречается в words, тем выше оно в подсказках.
+
+        Слова с символами, которых нет на клавиатуре, пропускаются.
+        """
+        digit_by_char = {char: digit for digit, chars in keypad.items() for char in chars}
+        completions = {}
+        for word, _ in sorted(Counter(words).items(), key=lambda item: (-item[1], item[0])):
+            try:
+                digits = ''.join(map(digit_by_char.__getitem__, word))
+            except KeyError:
+                continue
+            for end in range(1, len(digits) + 1):
+                candidates = completions.setdefault(digits[:end], [])
+                if len(candidates) < max_results:
+                    candidates.append(word)
+        return cls(completions, max_results)
+
+    def lookup(self, digits: str, k: int | None = None) -> list[str]:
+        """Возвращает до k (по умолчанию max_results) лучших слов, чей набор начинается с digits."""
+        return self.completions.get(digits, [])[:k]
+
+    def save(self, path: str):
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump({'max_results': self.max_results, 'completions': self.completions}, file, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path: str) -> 'PredictiveIndex':
+        with open(path, 'r', encoding='utf-8') as file:
+            data = json.load(file)
+        return cls(data['completions'], data['max_results'])
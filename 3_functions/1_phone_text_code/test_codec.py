@@ -0,0 +1,65 @@
+import io
+
+import pytest
+
+from codec import CODEC, KeypadError, StreamDecoder, StreamEncoder, iter_decode, iter_encode
+from decode.decode import DECODE_TABLE
+from encode.encode import ENCODE_TABLE
+
+TEXT = "давным давно... в далекой далекой галактике..."
+
+
+@pytest.mark.parametrize(
+    "texts",
+    [
+        ["привет, любимая!", "я люблю питон?", "a", ""],
+        [],
+    ]
+)
+def test_encode_decode_many(texts: list[str]):
+    encoded = CODEC.encode_many(texts)
+    assert encoded == [CODEC.encode(text) for text in texts]
+    assert CODEC.decode_many(code for code in encoded if code is not None) == [
+        text for text, code in zip(texts, encoded) if code is not None
+    ]
+
+
+@pytest.mark.parametrize("numbers", ["1111111", "00", "123 321", "2 x"])
+def test_decode_many_invalid(numbers: str):
+    assert CODEC.decode_many([numbers, "2"]) == [None, "а"]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 1000])
+def test_stream_round_trip(chunk_size: int):
+    encoded = "".join(iter_encode(io.StringIO(TEXT), chunk_size))
+    assert encoded == CODEC.encode(TEXT)
+    assert "".join(iter_decode(io.StringIO(encoded), chunk_size)) == TEXT
+
+
+def test_stream_decoder_feed_finish():
+    decoder = StreamDecoder()
+    assert decoder.feed("55") == ""
+    assert decoder.feed("55 6 4") == "пр"
+    assert decoder.feed(" ") == "и"
+    assert decoder.finish() == ""
+
+
+@pytest.mark.parametrize("chunks", [["1111111"], ["22 2222", "2"], ["2 x"], ["2 ", "2" * 100]])
+def test_stream_decoder_error(chunks: list[str]):
+    decoder = StreamDecoder()
+    with pytest.raises(KeypadError):
+        for chunk in chunks:
+            decoder.feed(chunk)
+        decoder.finish()
+
+
+def test_stream_encoder_error():
+    encoder = StreamEncoder()
+    assert encoder.feed("при") == "5555 6 4"
+    with pytest.raises(KeypadError):
+        encoder.feed("вет!a")
+
+
+def test_module_tables_match_codec():
+    assert ENCODE_TABLE == CODEC.encode_table
+    assert DECODE_TABLE == CODEC.decode_table
@@ -0,0 +1,38 @@
+import pytest
+
+from predictive import PredictiveIndex
+
+WORDS = ["привет", "привет", "прием", "приз", "пруд", "мир", "мир", "мир", "love"]
+
+
+@pytest.fixture
+def index() -> PredictiveIndex:
+    return PredictiveIndex.from_words(WORDS, max_results=3)
+
+
+@pytest.mark.parametrize(
+    "digits, expected",
+    [
+        ("5", ["мир", "привет", "прием"]),
+        ("56", ["привет", "прием", "приз"]),
+        ("564", ["привет", "прием", "приз"]),
+        ("5643", ["прием", "приз"]),
+        ("564236", ["привет"]),
+        ("566", ["пруд"]),
+        ("9", []),
+    ]
+)
+def test_lookup(index: PredictiveIndex, digits: str, expected: list[str]):
+    assert index.lookup(digits) == expected
+
+
+def test_lookup_top_k(index: PredictiveIndex):
+    assert index.lookup("5", k=1) == ["мир"]
+
+
+def test_save_load(index: PredictiveIndex, tmp_path):
+    path = tmp_path / "index.json"
+    index.save(str(path))
+    loaded = PredictiveIndex.load(str(path))
+    assert loaded.completions == index.completions
+    assert loaded.max_results == index.max_results
@@ -0,0 +1,87 @@
+"""Замеры калькулятора.
+
+expression - вычисление выражений через замыкания и через скомпилированное выражение.
+cache - операции калькулятора с CachedCalculator и без него.
+
+Запуск из папки задания:
+python bench.py [expression|cache]
+"""
+import random
+import sys
+import time
+import tracemalloc
+
+from cache import CachedCalculator
+from calculator import divided_by, eight, minus, plus, seven, three, times
+from expression import Operand, compile_expression, np
+
+BATCH_SIZE = 1_000_000
+
+
+def measure(func) -> tuple[float, list[int]]:
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def measure_memory(func) -> float:
+    """Пиковый объем памяти в МиБ, выделенной за время вызова func."""
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 2 ** 20
+
+
+def bench_expression():
+    rnd = random.Random(42)
+    xs = [rnd.randint(-1000, 1000) for _ in range(BATCH_SIZE)]
+    ys = [rnd.choice([-3, -2, -1, 1, 2, 3]) for _ in range(BATCH_SIZE)]
+
+    # (7 * x + y) // y - 7
+    def closures():
+        return [minus(seven())(divided_by(y)(plus(y)(seven(times(x))))) for x, y in zip(xs, ys)]
+
+    x, y = Operand('x'), Operand('y')
+    compiled = compile_expression(minus(seven())(divided_by(y)(plus(y)(seven(times(x))))))
+
+    closures_time, expected = measure(closures)
+    scalar_time, scalar_result = measure(lambda: list(map(compiled.function, xs, ys)))
+    batch_time, batch_result = measure(lambda: compiled.batch(x=xs, y=ys))
+    assert scalar_result == batch_result == expected
+
+    print(f'closures: {closures_time:.3f}s')
+    print(f'compiled, one by one: {scalar_time:.3f}s, speedup x{closures_time / scalar_time:.2f}')
+    print(
+        f'compiled, batch ({"numpy" if np is not None else "no numpy"}): {batch_time:.3f}s, '
+        f'speedup x{closures_time / batch_time:.2f}'
+    )
+
+
+def bench_cache():
+    calc = CachedCalculator()
+    digits = [value % 10 for value in range(BATCH_SIZE)]
+
+    # Вычисление сразу: поиск в кеше стоит столько же, сколько создание замыкания.
+    plain_time, expected = measure(lambda: [eight(minus(three())) for _ in range(BATCH_SIZE)])
+    cached_time, result = measure(lambda: [eight(calc.minus(three())) for _ in range(BATCH_SIZE)])
+    assert result == expected
+    print(f'eight(minus(three())): plain {plain_time:.3f}s, cached {cached_time:.3f}s')
+
+    # Отложенные операции: без кеша на каждую создается и хранится свое замыкание.
+    plain_time, _ = measure(lambda: [times(digit) for digit in digits])
+    cached_time, _ = measure(lambda: [calc.times(digit) for digit in digits])
+    plain_memory = measure_memory(lambda: [times(digit) for digit in digits])
+    cached_memory = measure_memory(lambda: [calc.times(digit) for digit in digits])
+    print(
+        f'{BATCH_SIZE} pending operations: plain {plain_time:.3f}s / {plain_memory:.1f} MiB, '
+        f'cached {cached_time:.3f}s / {cached_memory:.1f} MiB, speedup x{plain_time / cached_time:.2f}'
+    )
+
+
+if __name__ == '__main__':
+    benches = sys.argv[1:] or ['expression', 'cache']
+    if 'expression' in benches:
+        bench_expression()
+    if 'cache' in benches:
+        bench_cache()
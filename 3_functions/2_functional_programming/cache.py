@@ -0,0 +1,37 @@
+"""Опциональный кеш для операций калькулятора.
+
+Обычные plus/minus/times/divided_by создают новое замыкание на каждый вызов. CachedCalculator возвращает один и тот же
+объект операции для одного и того же операнда, поэтому отложенные операции (например, список операций над цифрами)
+не выделяют память под каждое замыкание:
+
+    calc = CachedCalculator(maxsize=1024)
+    eight(calc.minus(three()))   # 5
+    calc.times(5) is calc.times(5)  # True
+
+Результаты не кешируются: одна целочисленная операция дешевле любого поиска в кеше. Операнды должны быть
+хешируемыми, для остальных (например, numpy-массивов) используйте функции из calculator.py.
+"""
+import functools
+
+from calculator import divided_by, minus, plus, times
+
+OPERATIONS = ('plus', 'minus', 'times', 'divided_by')
+
+
+class CachedCalculator:
+    def __init__(self, maxsize: int = 1024):
+        # Кеш - это сам lru_cache над функцией калькулятора, без python-обертки: поиск в нем не дороже,
+        # чем создание нового замыкания. typed=True, чтобы 1 и True или 1 и 1.0 не делили одну запись.
+        cache = functools.lru_cache(maxsize=maxsize, typed=True)
+        self.plus = cache(plus)
+        self.minus = cache(minus)
+        self.times = cache(times)
+        self.divided_by = cache(divided_by)
+
+    def cache_info(self) -> dict[str, functools._CacheInfo]:
+        """Счетчики попаданий и промахов отдельно для каждой операции."""
+        return {name: getattr(self, name).cache_info() for name in OPERATIONS}
+
+    def cache_clear(self):
+        for name in OPERATIONS:
+            getattr(self, name).cache_clear()
@@ -0,0 +1,54 @@
+import pytest
+
+from cache import CachedCalculator
+from calculator import divided_by, eight, five, minus, plus, seven, three, times, zero
+
+
+@pytest.mark.parametrize(
+    "operation_name, operation",
+    [
+        ("plus", plus),
+        ("minus", minus),
+        ("times", times),
+        ("divided_by", divided_by),
+    ]
+)
+def test_cached_operations_match_calculator(operation_name, operation):
+    calc = CachedCalculator()
+    cached_operation = getattr(calc, operation_name)
+    for left in range(-9, 10):
+        for right in range(1, 10):
+            assert cached_operation(right)(left) == operation(right)(left)
+
+
+def test_operation_is_interned():
+    calc = CachedCalculator()
+    assert calc.times(5) is calc.times(five())
+    assert calc.times(5) is not calc.plus(5)
+    assert calc.times(True) is not calc.times(1)
+
+
+def test_operation_is_reused():
+    calc = CachedCalculator()
+    for _ in range(3):
+        assert eight(calc.minus(three())) == 5
+
+    info = calc.cache_info()
+    assert (info["minus"].hits, info["minus"].misses) == (2, 1)
+    assert info["plus"].currsize == 0
+
+    calc.cache_clear()
+    assert calc.cache_info()["minus"].currsize == 0
+
+
+def test_cache_is_bounded():
+    calc = CachedCalculator(maxsize=4)
+    for value in range(100):
+        seven(calc.plus(value))
+    assert calc.cache_info()["plus"].currsize == 4
+
+
+def test_division_by_zero():
+    calc = CachedCalculator()
+    with pytest.raises(ZeroDivisionError):
+        zero(calc.divided_by(zero()))
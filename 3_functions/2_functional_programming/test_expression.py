@@ -0,0 +1,105 @@
+import pytest
+
+from calculator import divided_by, eight, minus, nine, plus, seven, three, times, zero
+from expression import Expression, Operand, compile_expression
+
+OPERATIONS = [plus, minus, times, divided_by]
+
+
+@pytest.mark.parametrize("operation", OPERATIONS)
+def test_compiled_expression_matches_closures(operation):
+    x, y = Operand("x"), Operand("y")
+    evaluate = compile_expression(operation(y)(x))
+    xs = list(range(-9, 10))
+    ys = [value for value in range(-9, 10) if value != 0]
+
+    for left in xs:
+        for right in ys:
+            assert evaluate(x=left, y=right) == operation(right)(left)
+
+    batch_x = [left for left in xs for _ in ys]
+    batch_y = [right for _ in xs for right in ys]
+    assert evaluate.batch(x=batch_x, y=batch_y) == [operation(right)(left) for left, right in zip(batch_x, batch_y)]
+
+
+def test_nested_expression():
+    x = Operand("x")
+    evaluate = compile_expression(seven(times(eight(minus(x)))))
+    assert evaluate.operands == ["x"]
+    assert evaluate.batch(x=[0, 3, 9]) == [7 * (8 - value) for value in (0, 3, 9)]
+
+
+def test_constant_expression():
+    assert compile_expression(nine(divided_by(three())))() == 3
+
+
+def test_batch_division_by_zero():
+    evaluate = compile_expression(divided_by(Operand("y"))(Operand("x")))
+    with pytest.raises(ZeroDivisionError):
+        evaluate.batch(x=[1, 2], y=[1, 0])
+    with pytest.raises(ZeroDivisionError):
+        zero(divided_by(zero()))
+
+
+def test_invalid_operand_name():
+    with pytest.raises(ValueError):
+        Operand("not a name")
+
+
+def test_batch_without_numpy(monkeypatch):
+    import expression
+
+    monkeypatch.setattr(expression, "np", None)
+    evaluate = compile_expression(seven(plus(Operand("x"))))
+    assert evaluate.batch(x=[1, -2]) == [8, 5]
+
+
+@pytest.mark.parametrize("use_numpy", (True, False))
+def test_batch_without_operands(monkeypatch, use_numpy):
+    import expression
+
+    if not use_numpy:
+        monkeypatch.setattr(expression, "np", None)
+    evaluate = compile_expression(seven(times(three())))
+    assert evaluate.batch(x=[1, 2, 3]) == [21, 21, 21]
+    assert evaluate.batch(size=2) == [21, 21]
+    with pytest.raises(ValueError):
+        evaluate.batch()
+
+
+@pytest.mark.parametrize("use_numpy", (True, False))
+def test_batch_keeps_exact_integers_outside_int64(monkeypatch, use_numpy):
+    import expression
+
+    if not use_numpy:
+        monkeypatch.setattr(expression, "np", None)
+    x = Operand("x")
+    assert compile_expression(seven(times(x))).batch(x=[2 ** 61, 1]) == [7 * 2 ** 61, 7]
+    # Промежуточное произведение переполняет int64, хотя итоговый результат в него помещается.
+    assert compile_expression(zero(times(x * x))).batch(x=[2 ** 40]) == [0]
+    assert compile_expression(seven(plus(x))).batch(x=[2 ** 70]) == [2 ** 70 + 7]
+
+
+@pytest.mark.parametrize("use_numpy", (True, False))
+def test_batch_matches_scalar_call_for_any_columns(monkeypatch, use_numpy):
+    import expression
+
+    if not use_numpy:
+        monkeypatch.setattr(expression, "np", None)
+    x, y = Operand("x"), Operand("y")
+    evaluate = compile_expression(seven(times(x)))
+    assert evaluate.batch(x=[1.5, 2]) == [evaluate(x=1.5), evaluate(x=2)]
+    assert evaluate.batch(x=(value for value in range(3))) == [0, 7, 14]
+    assert evaluate.batch(x=[]) == []
+
+    with pytest.raises(ValueError):
+        compile_expression(x + y).batch(x=[1, 2, 3], y=[1, 2])
+    with pytest.raises(ValueError):
+        evaluate.batch(y=[1])
+    with pytest.raises(ValueError):
+        compile_expression(seven()).batch(size=2, x=[1, 2, 3])
+
+
+def test_expression_is_abstract():
+    with pytest.raises(TypeError):
+        Expression()
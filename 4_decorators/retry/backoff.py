@@ -0,0 +1,55 @@
+"""Стратегии задержки между попытками для retry.
+
+Стратегия - это функция, которая по базовой задержке и верхней границе задержки в секундах (None - без границы)
+возвращает бесконечный итератор задержек: первая задержка - перед второй попыткой, вторая - перед третьей и т.д.
+Граница применяется до случайного разброса, поэтому и после ее достижения задержки остаются разными.
+"""
+import random
+from typing import Callable, Iterator
+
+Backoff = Callable[[float, float | None], Iterator[float]]
+
+
+def constant() -> Backoff:
+    """Одна и та же задержка перед каждой попыткой - поведение retry по умолчанию."""
+    def delays(delay: float, max_delay: float | None = None) -> Iterator[float]:
+        if max_delay is not None:
+            delay = min(delay, max_delay)
+        while True:
+            yield delay
+    return delays
+
+
+def exponential(factor: float = 2.0, jitter: bool = False, rnd: random.Random | None = None) -> Backoff:
+    """Задержка растет как delay * factor ** n.
+
+    С jitter=True берется случайная задержка от 0 до этого значения ("full jitter"), чтобы клиенты,
+    упавшие одновременно, не повторяли запросы синхронно. Значение ограничивается max_delay до разброса.
+    """
+    rnd = rnd or random.Random()
+
+    def delays(delay: float, max_delay: float | None = None) -> Iterator[float]:
+        current = delay
+        while True:
+            if max_delay is not None and current >= max_delay:
+                # Дальше расти незачем: граница достигнута, а current не уходит в бесконечность.
+                current = max_delay
+            yield rnd.uniform(0, current) if jitter else current
+            current *= factor
+    return delays
+
+
+def decorrelated_jitter(rnd: random.Random | None = None) -> Backoff:
+    """Каждая следующая задержка случайна в диапазоне от delay до утроенной предыдущей задержки.
+
+    Верхний край диапазона ограничивается max_delay до розыгрыша, поэтому задержки не прижимаются к границе.
+    """
+    rnd = rnd or random.Random()
+
+    def delays(delay: float, max_delay: float | None = None) -> Iterator[float]:
+        current = delay
+        while True:
+            high = current * 3 if max_delay is None else min(current * 3, max_delay)
+            current = rnd.uniform(min(delay, high), high)
+            yield current
+    return delays
@@ -0,0 +1,108 @@
+"""Замеры для retry.
+
+storm - симуляция "шторма повторов": много клиентов одновременно упираются в недоступную зависимость.
+Время виртуальное, реальных задержек нет. Для каждой стратегии считается пиковая нагрузка повторами на зависимость
+(повторных запросов за интервал), отдельно - пиковая нагрузка после MAX_DELAY секунд, когда задержки упираются
+в границу, и общее количество повторов до ее восстановления.
+
+budget - общий бюджет повторов под конкуренцией потоков: пропускная способность и доля повторов.
+
+Запуск из папки 4_decorators:
+python -m retry.bench [storm|budget]
+"""
+import heapq
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import timedelta
+
+from .backoff import Backoff, constant, decorrelated_jitter, exponential
+from .budget import RetryBudget
+from .retry import retry
+
+CLIENTS_COUNT = 10_000
+ATTEMPTS_COUNT = 10
+BASE_DELAY = 0.1
+MAX_DELAY = 5.0
+RECOVERY_TIME = 10.0
+BUCKET = 0.1
+THREADS_COUNT = 32
+CALLS_PER_THREAD = 5_000
+
+
+def simulate(backoff: Backoff) -> tuple[int, int, int]:
+    rnd = random.Random(42)
+    retries = Counter()
+    # (время вызова, номер клиента, номер попытки, итератор задержек клиента)
+    events = [(rnd.uniform(0, BUCKET), client, 1, backoff(BASE_DELAY, MAX_DELAY)) for client in range(CLIENTS_COUNT)]
+    heapq.heapify(events)
+
+    while events:
+        at, client, attempt, delays = heapq.heappop(events)
+        if at >= RECOVERY_TIME:
+            continue
+        if attempt > 1:
+            retries[int(at / BUCKET)] += 1
+        if attempt < ATTEMPTS_COUNT:
+            heapq.heappush(events, (at + next(delays), client, attempt + 1, delays))
+
+    late_peak = max((count for bucket, count in retries.items() if bucket * BUCKET >= MAX_DELAY), default=0)
+    return max(retries.values()), late_peak, sum(retries.values())
+
+
+def bench_storm():
+    strategies = {
+        'constant': constant(),
+        'exponential': exponential(),
+        'exponential + full jitter': exponential(jitter=True, rnd=random.Random(1)),
+        'decorrelated jitter': decorrelated_jitter(rnd=random.Random(1)),
+    }
+    print(f'{CLIENTS_COUNT} clients, dependency is down for {RECOVERY_TIME}s, load per {BUCKET}s interval')
+    for name, backoff in strategies.items():
+        peak, late_peak, total = simulate(backoff)
+        print(f'{name}: peak {peak} retries, after {MAX_DELAY:g}s {late_peak}, total {total} retries during outage')
+
+
+def bench_budget():
+    for budget in (None, RetryBudget(ratio=0.2)):
+        first_attempts = Counter()
+        attempts = Counter()
+
+        def sick_backend():
+            attempts[threading.get_ident()] += 1
+            raise ConnectionError
+
+        call = retry(5, timedelta(), budget=budget)(sick_backend)
+
+        def worker():
+            for _ in range(CALLS_PER_THREAD):
+                first_attempts[threading.get_ident()] += 1
+                try:
+                    call()
+                except ConnectionError:
+                    pass
+
+        threads = [threading.Thread(target=worker) for _ in range(THREADS_COUNT)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        calls = sum(first_attempts.values())
+        load = sum(attempts.values()) / calls
+        print(
+            f'{"with budget" if budget else "no budget"}: {THREADS_COUNT} threads, '
+            f'{calls / elapsed:,.0f} calls/s, backend load x{load:.2f} of first attempts'
+        )
+
+
+if __name__ == '__main__':
+    benches = sys.argv[1:] or ['storm', 'budget']
+    if 'storm' in benches:
+        bench_storm()
+    if 'budget' in benches:
+        bench_budget()
@@ -0,0 +1,52 @@
+"""Бюджет повторов: общий на процесс token bucket, который ограничивает долю повторов относительно первых попыток.
+
+Каждый первый вызов кладет в бюджет ratio токенов, каждый повтор забирает один. Когда токены кончаются, retry
+перестает повторять и сразу выбрасывает исключение, поэтому при отказе зависимости нагрузка на нее растет
+не больше чем в (1 + ratio) раз.
+"""
+import threading
+
+DEFAULT_RATIO = 0.2
+DEFAULT_CAPACITY = 10.0
+
+
+class RetryBudget:
+    def __init__(self, ratio: float = DEFAULT_RATIO, capacity: float = DEFAULT_CAPACITY):
+        if ratio < 0 or capacity < 0:
+            raise ValueError("ratio и capacity не могут быть отрицательными")
+        self.ratio = ratio
+        self.capacity = capacity
+        self._tokens = capacity
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        return self._tokens
+
+    def deposit(self):
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + self.ratio)
+
+    def try_withdraw(self) -> bool:
+        """Забирает токен на один повтор; False, если бюджет исчерпан."""
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+_budgets: dict[str, RetryBudget] = {}
+_budgets_lock = threading.Lock()
+
+
+def get_retry_budget(name: str, ratio: float = DEFAULT_RATIO, capacity: float = DEFAULT_CAPACITY) -> RetryBudget:
+    """Возвращает общий бюджет с именем name, создавая его при первом обращении.
+
+    ratio и capacity учитываются только при создании.
+    """
+    with _budgets_lock:
+        budget = _budgets.get(name)
+        if budget is None:
+            budget = _budgets[name] = RetryBudget(ratio, capacity)
+        return budget
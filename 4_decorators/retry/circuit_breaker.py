@@ -0,0 +1,141 @@
+"""Автоматический выключатель (circuit breaker) для вызовов нестабильной зависимости.
+
+Состояния:
+- closed - вызовы проходят, подряд идущие ошибки считаются;
+- open - после failure_threshold ошибок подряд вызовы сразу завершаются CircuitOpenError, не трогая зависимость;
+- half_open - через recovery_timeout пропускается один пробный вызов: успех замыкает цепь, ошибка снова размыкает.
+"""
+import enum
+import inspect
+import threading
+import time
+from datetime import timedelta
+from functools import wraps
+from typing import Callable
+
+
+class CircuitState(enum.Enum):
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(Exception):
+    """Цепь разомкнута: вызов отклонен без обращения к зависимости."""
+
+
+class CircuitBreaker:
+    """Один выключатель разделяется всеми вызовами функций, которые им обернуты; потокобезопасен."""
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: timedelta = timedelta(seconds=30),
+        handled_exceptions: tuple[type[Exception], ...] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold должен быть больше или равен 1")
+
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout.total_seconds()
+        self.handled_exceptions = handled_exceptions or (Exception,)
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self.consecutive_failures = 0
+        self.successes = 0
+        self.failures = 0
+        self.rejected = 0
+        self.times_opened = 0
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            return self._current_state()
+
+    def stats(self) -> dict[str, int | str]:
+        with self._lock:
+            return {
+                'state': self._current_state().value,
+                'consecutive_failures': self.consecutive_failures,
+                'successes': self.successes,
+                'failures': self.failures,
+                'rejected': self.rejected,
+                'times_opened': self.times_opened,
+            }
+
+    def before_call(self):
+        """Проверяет, можно ли сделать вызов; если нет - выбрасывает CircuitOpenError."""
+        with self._lock:
+            self._state = self._current_state()
+            if self._state is CircuitState.CLOSED:
+                return
+            if self._state is CircuitState.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return
+            self.rejected += 1
+        raise CircuitOpenError("цепь разомкнута, вызов отклонен")
+
+    def record_success(self):
+        with self._lock:
+            self.successes += 1
+            self.consecutive_failures = 0
+            self._trial_in_flight = False
+            self._state = CircuitState.CLOSED
+
+    def record_ignored(self):
+        """Вызов завершился исключением, которое не считается отказом зависимости: счетчики не меняются."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self.consecutive_failures += 1
+            self._trial_in_flight = False
+            if self._state is CircuitState.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                if self._state is not CircuitState.OPEN:
+                    self.times_opened += 1
+                self._state = CircuitState.OPEN
+                self._opened_at = self._clock()
+
+    def _current_state(self) -> CircuitState:
+        if self._state is CircuitState.OPEN and self._clock() - self._opened_at >= self.recovery_timeout:
+            return CircuitState.HALF_OPEN
+        return self._state
+
+    def __call__(self, func):
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                self.before_call()
+                try:
+                    result = await func(*args, **kwargs)
+                except self.handled_exceptions:
+                    self.record_failure()
+                    raise
+                except BaseException:
+                    self.record_ignored()
+                    raise
+                self.record_success()
+                return result
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            self.before_call()
+            try:
+                result = func(*args, **kwargs)
+            except self.handled_exceptions:
+                self.record_failure()
+                raise
+            except BaseException:
+                self.record_ignored()
+                raise
+            self.record_success()
+            return result
+        return wrapper
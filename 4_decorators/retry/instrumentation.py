@@ -0,0 +1,63 @@
+"""Счетчики и гистограмма задержек для функций, обернутых retry.
+
+Статистика собирается всегда и доступна как func.retry_stats. Ее можно выгрузить в Statsd из 6_classes/1_metrics
+(подойдет любой объект с методом incr(name, value)).
+Счетчики обновляются без блокировок, поэтому при сильной конкуренции потоков отдельные инкременты могут теряться.
+"""
+import bisect
+from typing import Protocol
+
+# Верхние границы интервалов гистограммы длительности вызова в секундах; последний интервал - все, что больше.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class StatsClient(Protocol):
+    def incr(self, name: str, value: int = 1):
+        pass
+
+
+class RetryStats:
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.calls = 0
+        self.successes = 0
+        self.giveups = 0
+        self.retries = 0
+        self.sleep_time = 0.0
+        self.latency_counts = [0] * (len(buckets) + 1)
+        self._exported: dict[str, int] = {}
+
+    def record_success(self, elapsed: float):
+        self.calls += 1
+        self.successes += 1
+        self.latency_counts[bisect.bisect_left(self.buckets, elapsed)] += 1
+
+    def record_retry(self, delay: float):
+        self.retries += 1
+        self.sleep_time += delay
+
+    def record_giveup(self, elapsed: float):
+        self.calls += 1
+        self.giveups += 1
+        self.latency_counts[bisect.bisect_left(self.buckets, elapsed)] += 1
+
+    def counters(self) -> dict[str, int]:
+        counters = {
+            'calls': self.calls,
+            'successes': self.successes,
+            'giveups': self.giveups,
+            'retries': self.retries,
+            'sleep_ms': int(self.sleep_time * 1000),
+        }
+        for bound, count in zip(self.buckets, self.latency_counts):
+            counters[f'latency_le_{bound:g}s'] = count
+        counters['latency_inf'] = self.latency_counts[-1]
+        return counters
+
+    def export(self, client: StatsClient, prefix: str):
+        """Отправляет в client приращения счетчиков с прошлой выгрузки, например в Statsd."""
+        for name, value in self.counters().items():
+            delta = value - self._exported.get(name, 0)
+            if delta:
+                client.incr(f'{prefix}.{name}', delta)
+            self._exported[name] = value
@@ -1,26 +1,216 @@
 # реализуйте декоратор вида @retry(count: int, delay: timedelta, handled_exceptions: tuple[type(Exceptions)])
+import asyncio
+import inspect
 import time
 from datetime import timedelta
 from functools import wraps
+from typing import Callable
 
-def retry(count, delay, handled_exceptions=None):
+from .backoff import Backoff, constant
+from .budget import RetryBudget, get_retry_budget
+from .circuit_breaker import CircuitBreaker, CircuitOpenError
+from .instrumentation import RetryStats
+
+
+class _RetryPolicy:
+    """Настройки retry для одной обернутой функции и ее статистика."""
+
+    def __init__(
+        self,
+        count: int,
+        delay: float,
+        backoff: Backoff,
+        max_delay: float | None,
+        deadline: float | None,
+        budget: RetryBudget | None,
+        on_retry: Callable[[int, Exception, float], None] | None,
+        on_giveup: Callable[[int, Exception], None] | None,
+        on_success: Callable[[int, float], None] | None,
+    ):
+        self.count = count
+        self.delay = delay
+        self.backoff = backoff
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.budget = budget
+        self.on_retry = on_retry
+        self.on_giveup = on_giveup
+        self.on_success = on_success
+        self.stats = RetryStats()
+
+    def succeeded(self, state: '_RetryState | None', started_at: float):
+        elapsed = time.monotonic() - started_at
+        self.stats.record_success(elapsed)
+        if self.on_success is not None:
+            self.on_success(_current_attempt(state), elapsed)
+
+    def gave_up(self, attempt: int, started_at: float, exception: Exception):
+        self.stats.record_giveup(time.monotonic() - started_at)
+        if self.on_giveup is not None:
+            self.on_giveup(attempt, exception)
+
+    def escaped(self, state: '_RetryState | None', started_at: float, exception: Exception):
+        """Исключение, которое не повторяется (не из handled_exceptions или CircuitOpenError), уходит наружу."""
+        self.gave_up(_current_attempt(state), started_at, exception)
+
+
+class _RetryState:
+    """Состояние одного вызова: сколько попыток сделано и сколько ждать перед следующей.
+
+    Создается только после первой неудачной попытки, чтобы успешный с первого раза вызов ничего не выделял.
+    """
+
+    def __init__(self, policy: _RetryPolicy, started_at: float):
+        self.policy = policy
+        self.started_at = started_at
+        self.attempts = 0
+        self.delays = policy.backoff(policy.delay, policy.max_delay)
+        self.deadline_at = None if policy.deadline is None else started_at + policy.deadline
+
+    def next_delay(self) -> float | None:
+        """Регистрирует неудачную попытку и возвращает задержку перед следующей или None, если пора сдаться."""
+        self.attempts += 1
+        if self.attempts >= self.policy.count:
+            return None
+
+        # Граница max_delay уже учтена стратегией: она ограничивает задержку до случайного разброса.
+        delay = next(self.delays)
+        if self.deadline_at is not None and time.monotonic() + delay > self.deadline_at:
+            return None
+        if self.policy.budget is not None and not self.policy.budget.try_withdraw():
+            return None
+        return delay
+
+    def failed(self, exception: Exception) -> float | None:
+        """То же, что next_delay, но еще и обновляет статистику и вызывает хуки."""
+        policy = self.policy
+        delay = self.next_delay()
+        if delay is None:
+            policy.gave_up(self.attempts, self.started_at, exception)
+        else:
+            policy.stats.record_retry(delay)
+            if policy.on_retry is not None:
+                policy.on_retry(self.attempts, exception, delay)
+        return delay
+
+
+def _current_attempt(state: _RetryState | None) -> int:
+    """Номер текущей попытки: до первой неудачи состояния еще нет."""
+    return 1 if state is None else state.attempts + 1
+
+
+def retry(
+    count: int,
+    delay: timedelta,
+    handled_exceptions: tuple[type[Exception], ...] | None = None,
+    backoff: Backoff | None = None,
+    max_delay: timedelta | None = None,
+    deadline: timedelta | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    budget: RetryBudget | str | None = None,
+    on_retry: Callable[[int, Exception, float], None] | None = None,
+    on_giveup: Callable[[int, Exception], None] | None = None,
+    on_success: Callable[[int, float], None] | None = None,
+):
+    """Повторяет вызов функции до count раз, если она выбросила одно из handled_exceptions.
+
+    Статистика вызовов обернутой функции доступна как func.retry_stats (см. instrumentation.py).
+
+    Args:
+        count: максимальное количество попыток.
+        delay: базовая задержка между попытками.
+        handled_exceptions: исключения, после которых есть смысл повторить вызов; по умолчанию - все.
+        backoff: стратегия задержек из backoff.py; по умолчанию задержка постоянная.
+        max_delay: верхняя граница одной задержки, передается в стратегию backoff.
+        deadline: общий бюджет времени на вызов; если следующая попытка в него не укладывается,
+            последнее исключение выбрасывается сразу, не дожидаясь конца задержки.
+        circuit_breaker: выключатель, через который проходит каждая попытка. Пока цепь разомкнута,
+            CircuitOpenError выбрасывается сразу, без повторов и задержек.
+        budget: бюджет повторов (см. budget.py) или имя общего бюджета. Когда он исчерпан,
+            исключение выбрасывается сразу, без задержки.
+        on_retry: хук перед задержкой, получает номер неудачной попытки, исключение и задержку в секундах.
+        on_giveup: хук перед тем, как любое исключение будет выброшено наружу, в том числе не из
+            handled_exceptions: номер последней попытки и исключение.
+        on_success: хук после успешного вызова: номер удачной попытки и длительность вызова в секундах.
+    """
     if count < 1:
         raise ValueError("Count должен быть больше или равен 1")
 
     if handled_exceptions is None:
         handled_exceptions = (Exception,)
+    if backoff is None:
+        backoff = constant()
+
+    delay_seconds = delay.total_seconds()
+    max_delay_seconds = None if max_delay is None else max_delay.total_seconds()
+    deadline_seconds = None if deadline is None else deadline.total_seconds()
+    if isinstance(budget, str):
+        budget = get_retry_budget(budget)
 
     def decorator(func):
+        policy = _RetryPolicy(
+            count, delay_seconds, backoff, max_delay_seconds, deadline_seconds, budget, on_retry, on_giveup, on_success,
+        )
+        if circuit_breaker is not None:
+            func = circuit_breaker(func)
+
+        if inspect.iscoroutinefunction(func):
+            # Для корутин ждем через asyncio.sleep, чтобы не блокировать event loop на время задержки.
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                started_at = time.monotonic()
+                state = None
+                if budget is not None:
+                    budget.deposit()
+                while True:
+                    try:
+                        result = await func(*args, **kwargs)
+                    except CircuitOpenError as e:
+                        policy.escaped(state, started_at, e)
+                        raise
+                    except handled_exceptions as e:
+                        if state is None:
+                            state = _RetryState(policy, started_at)
+                        next_delay = state.failed(e)
+                        if next_delay is None:
+                            raise
+                    except Exception as e:
+                        policy.escaped(state, started_at, e)
+                        raise
+                    else:
+                        policy.succeeded(state, started_at)
+                        return result
+                    await asyncio.sleep(next_delay)
+
+            async_wrapper.retry_stats = policy.stats
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            attempts = 0
-            while attempts < count:
+            started_at = time.monotonic()
+            state = None
+            if budget is not None:
+                budget.deposit()
+            while True:
                 try:
-                    return func(*args, **kwargs)
+                    result = func(*args, **kwargs)
+                except CircuitOpenError as e:
+                    policy.escaped(state, started_at, e)
+                    raise
                 except handled_exceptions as e:
-                    attempts += 1
-                    if attempts >= count:
-                        raise e
-                    time.sleep(delay.total_seconds())
+                    if state is None:
+                        state = _RetryState(policy, started_at)
+                    next_delay = state.failed(e)
+                    if next_delay is None:
+                        raise
+                except Exception as e:
+                    policy.escaped(state, started_at, e)
+                    raise
+                else:
+                    policy.succeeded(state, started_at)
+                    return result
+                time.sleep(next_delay)
+
+        wrapper.retry_stats = policy.stats
         return wrapper
     return decorator
@@ -0,0 +1,135 @@
+import threading
+from datetime import timedelta
+
+import pytest
+
+from .circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+from .retry import retry
+from .test_retry import RetryStub
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_breaker(clock: FakeClock, failure_threshold: int = 3) -> CircuitBreaker:
+    return CircuitBreaker(failure_threshold, timedelta(seconds=10), handled_exceptions=(ValueError,), clock=clock)
+
+
+def test_breaker_opens_after_consecutive_failures():
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+    stub = RetryStub(count_unsuccessful_calls=3, raised_exception=ValueError)
+    execute = breaker(stub.execute)
+
+    for _ in range(3):
+        with pytest.raises(ValueError):
+            execute()
+    assert breaker.state is CircuitState.OPEN
+
+    with pytest.raises(CircuitOpenError):
+        execute()
+    assert stub.total_calls == 3
+    assert breaker.stats() == {
+        "state": "open",
+        "consecutive_failures": 3,
+        "successes": 0,
+        "failures": 3,
+        "rejected": 1,
+        "times_opened": 1,
+    }
+
+
+def test_breaker_half_open_trial():
+    clock = FakeClock()
+    breaker = make_breaker(clock, failure_threshold=1)
+    stub = RetryStub(count_unsuccessful_calls=2, raised_exception=ValueError)
+    execute = breaker(stub.execute)
+
+    with pytest.raises(ValueError):
+        execute()
+    clock.now = 10
+    assert breaker.state is CircuitState.HALF_OPEN
+
+    with pytest.raises(ValueError):
+        execute()
+    assert breaker.state is CircuitState.OPEN
+
+    clock.now = 20
+    assert execute() is True
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_breaker_ignores_unhandled_exceptions():
+    breaker = make_breaker(FakeClock(), failure_threshold=1)
+    execute = breaker(RetryStub(count_unsuccessful_calls=5, raised_exception=KeyError).execute)
+    for _ in range(5):
+        with pytest.raises(KeyError):
+            execute()
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_retry_short_circuits_when_open():
+    clock = FakeClock()
+    breaker = make_breaker(clock, failure_threshold=2)
+    stub = RetryStub(count_unsuccessful_calls=10, raised_exception=ValueError)
+    execute = retry(5, timedelta(milliseconds=10), circuit_breaker=breaker)(stub.execute)
+
+    with pytest.raises(CircuitOpenError):
+        execute()
+    assert stub.total_calls == 2
+
+    with pytest.raises(CircuitOpenError):
+        execute()
+    assert stub.total_calls == 2
+
+
+def test_retry_records_circuit_open_as_giveup():
+    events = []
+    clock = FakeClock()
+    breaker = make_breaker(clock, failure_threshold=2)
+    stub = RetryStub(count_unsuccessful_calls=10, raised_exception=ValueError)
+    execute = retry(
+        5,
+        timedelta(),
+        circuit_breaker=breaker,
+        on_giveup=lambda attempt, error: events.append((attempt, type(error))),
+    )(stub.execute)
+
+    with pytest.raises(CircuitOpenError):
+        execute()
+    with pytest.raises(CircuitOpenError):
+        execute()
+
+    # Цепь разомкнулась на третьей попытке первого вызова, второй вызов отклонен с первой же попытки.
+    assert events == [(3, CircuitOpenError), (1, CircuitOpenError)]
+    counters = execute.retry_stats.counters()
+    assert (counters["calls"], counters["giveups"], counters["retries"]) == (2, 2, 2)
+
+
+def test_breaker_thread_safety():
+    breaker = CircuitBreaker(failure_threshold=500, handled_exceptions=(ValueError,))
+    execute = breaker(RetryStub(count_unsuccessful_calls=10 ** 6, raised_exception=ValueError).execute)
+
+    def worker():
+        for _ in range(100):
+            try:
+                execute()
+            except (ValueError, CircuitOpenError):
+                pass
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = breaker.stats()
+    assert stats["state"] == "open"
+    assert stats["times_opened"] == 1
+    assert stats["failures"] >= 500
+    assert stats["failures"] + stats["rejected"] == 8 * 100
@@ -1,8 +1,12 @@
+import asyncio
+import random
 import time
 from datetime import timedelta
 
 import pytest
 
+from .backoff import constant, decorrelated_jitter, exponential
+from .budget import RetryBudget, get_retry_budget
 from .retry import retry
 
 
@@ -21,6 +25,11 @@ class RetryStub:
         return True
 
 
+class AsyncRetryStub(RetryStub):
+    async def execute(self, *args, **kwargs) -> bool:
+        return RetryStub.execute(self, *args, **kwargs)
+
+
 def test_function_with_incorrect_count_retry():
     stub = RetryStub()
     with pytest.raises(ValueError):
@@ -118,3 +127,226 @@ def test_handle_preset_exceptions():
     expected_time = timedelta(milliseconds=500).total_seconds()
     assert result_time < expected_time
     assert stub.total_calls == 1
+
+
+@pytest.mark.parametrize(
+    "count_errors",
+    [
+        0,
+        1,
+        3,
+    ]
+)
+def test_async_function_with_exception_on_set_call(count_errors):
+    stub = AsyncRetryStub(count_unsuccessful_calls=count_errors)
+    stub.execute = retry(count_errors + 1, timedelta(milliseconds=100))(stub.execute)
+    start = time.monotonic()
+    result = asyncio.run(stub.execute())
+    result_time = time.monotonic() - start
+    assert result is True
+    assert result_time >= timedelta(milliseconds=100).total_seconds() * count_errors
+    assert stub.total_calls == count_errors + 1
+
+
+def test_async_function_with_exception_after_all_try():
+    stub = AsyncRetryStub(count_unsuccessful_calls=2, raised_exception=ValueError)
+    stub.execute = retry(2, timedelta(milliseconds=100), handled_exceptions=(ValueError,))(stub.execute)
+    with pytest.raises(ValueError):
+        asyncio.run(stub.execute())
+    assert stub.total_calls == 2
+
+
+def test_async_backoff_does_not_block_event_loop():
+    stub = AsyncRetryStub(count_unsuccessful_calls=2)
+    stub.execute = retry(3, timedelta(milliseconds=200))(stub.execute)
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.01)
+
+    async def main():
+        ticker_task = asyncio.create_task(ticker())
+        result = await stub.execute()
+        ticker_task.cancel()
+        return result
+
+    assert asyncio.run(main()) is True
+    assert len(ticks) > 10
+
+
+@pytest.mark.parametrize(
+    "backoff, expected",
+    [
+        (constant(), [1.0, 1.0, 1.0, 1.0]),
+        (exponential(), [1.0, 2.0, 4.0, 8.0]),
+        (exponential(factor=3), [1.0, 3.0, 9.0, 27.0]),
+    ]
+)
+def test_backoff_delays(backoff, expected):
+    delays = backoff(1.0)
+    assert [next(delays) for _ in expected] == expected
+
+
+@pytest.mark.parametrize("backoff", [exponential(jitter=True), decorrelated_jitter()])
+def test_jitter_backoff_delays(backoff):
+    delays = backoff(1.0)
+    values = [next(delays) for _ in range(100)]
+    assert all(value >= 0 for value in values)
+    assert len(set(values)) > 1
+
+
+@pytest.mark.parametrize(
+    "backoff", [exponential(jitter=True, rnd=random.Random(1)), decorrelated_jitter(rnd=random.Random(1))]
+)
+def test_jitter_stays_spread_after_max_delay(backoff):
+    # Через 20 попыток граница давно достигнута, но задержки по-прежнему разные, а не ровно max_delay.
+    values = []
+    for _ in range(1000):
+        delays = backoff(0.1, 5.0)
+        values.append([next(delays) for _ in range(20)][-1])
+    assert all(0 <= value <= 5.0 for value in values)
+    assert sum(value == 5.0 for value in values) < 10
+    assert len(set(values)) > 900
+
+
+def test_exponential_backoff_with_max_delay(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+    stub = RetryStub(count_unsuccessful_calls=4)
+    stub.execute = retry(
+        5, timedelta(seconds=1), backoff=exponential(), max_delay=timedelta(seconds=3),
+    )(stub.execute)
+
+    assert stub.execute() is True
+    assert sleeps == [1.0, 2.0, 3.0, 3.0]
+
+
+def test_deadline_stops_retrying_early():
+    stub = RetryStub(count_unsuccessful_calls=10)
+    stub.execute = retry(
+        10, timedelta(milliseconds=200), deadline=timedelta(milliseconds=500),
+    )(stub.execute)
+    start = time.monotonic()
+    with pytest.raises(Exception):
+        stub.execute()
+    result_time = time.monotonic() - start
+    assert stub.total_calls == 3
+    assert result_time < timedelta(milliseconds=500).total_seconds()
+
+
+class FakeStatsd:
+    def __init__(self):
+        self.metrics = []
+
+    def incr(self, name: str, value: int = 1):
+        self.metrics.append((name, value))
+
+
+def test_retry_hooks_and_stats():
+    events = []
+    stub = RetryStub(count_unsuccessful_calls=2, raised_exception=ValueError)
+    stub.execute = retry(
+        3,
+        timedelta(milliseconds=10),
+        on_retry=lambda attempt, error, delay: events.append(("retry", attempt, type(error), delay)),
+        on_giveup=lambda attempt, error: events.append(("giveup", attempt, type(error))),
+        on_success=lambda attempt, elapsed: events.append(("success", attempt)),
+    )(stub.execute)
+
+    assert stub.execute() is True
+    assert events == [("retry", 1, ValueError, 0.01), ("retry", 2, ValueError, 0.01), ("success", 3)]
+
+    stub._count_unsuccessful_calls = 3
+    with pytest.raises(ValueError):
+        stub.execute()
+    assert events[-1] == ("giveup", 3, ValueError)
+
+    counters = stub.execute.retry_stats.counters()
+    assert (counters["calls"], counters["successes"], counters["giveups"], counters["retries"]) == (2, 1, 1, 4)
+    assert counters["sleep_ms"] == 40
+    assert sum(count for name, count in counters.items() if name.startswith("latency")) == 2
+
+
+def test_unhandled_exception_is_recorded_as_giveup():
+    events = []
+    stub = RetryStub(count_unsuccessful_calls=5, raised_exception=KeyError)
+    stub.execute = retry(
+        3,
+        timedelta(),
+        handled_exceptions=(ValueError,),
+        on_giveup=lambda attempt, error: events.append((attempt, type(error))),
+    )(stub.execute)
+
+    for _ in range(5):
+        with pytest.raises(KeyError):
+            stub.execute()
+
+    assert events == [(1, KeyError)] * 5
+    counters = stub.execute.retry_stats.counters()
+    assert (counters["calls"], counters["giveups"], counters["retries"]) == (5, 5, 0)
+    assert sum(count for name, count in counters.items() if name.startswith("latency")) == 5
+
+
+def test_retry_stats_export():
+    stub = RetryStub(count_unsuccessful_calls=1)
+    stub.execute = retry(2, timedelta(milliseconds=1))(stub.execute)
+    statsd = FakeStatsd()
+
+    stub.execute()
+    stub.execute.retry_stats.export(statsd, "stub")
+    assert ("stub.calls", 1) in statsd.metrics
+    assert ("stub.retries", 1) in statsd.metrics
+
+    statsd.metrics.clear()
+    stub.execute()
+    stub.execute.retry_stats.export(statsd, "stub")
+    assert ("stub.calls", 1) in statsd.metrics
+    assert all(not name.endswith("retries") for name, _ in statsd.metrics)
+
+
+def test_retry_budget_token_bucket():
+    budget = RetryBudget(ratio=0.5, capacity=2)
+    assert [budget.try_withdraw() for _ in range(3)] == [True, True, False]
+    budget.deposit()
+    assert budget.try_withdraw() is False
+    budget.deposit()
+    assert budget.try_withdraw() is True
+    for _ in range(10):
+        budget.deposit()
+    assert budget.tokens == 2
+
+
+def test_retry_gives_up_when_budget_is_exhausted(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+    budget = RetryBudget(ratio=0, capacity=2)
+    stub = RetryStub(count_unsuccessful_calls=10)
+    stub.execute = retry(10, timedelta(milliseconds=1), budget=budget)(stub.execute)
+
+    with pytest.raises(Exception):
+        stub.execute()
+    assert stub.total_calls == 3
+    assert sleeps == [0.001, 0.001]
+
+    sleeps.clear()
+    with pytest.raises(Exception):
+        stub.execute()
+    assert stub.total_calls == 4
+    assert sleeps == []
+
+
+def test_named_budget_is_shared():
+    first = RetryStub(count_unsuccessful_calls=10)
+    second = RetryStub(count_unsuccessful_calls=10)
+    first.execute = retry(10, timedelta(), budget="test_named_budget_is_shared")(first.execute)
+    second.execute = retry(10, timedelta(), budget="test_named_budget_is_shared")(second.execute)
+    assert get_retry_budget("test_named_budget_is_shared").capacity == 10
+
+    # Первый вызов тратит 9 из 10 токенов, второму остается 1 + 0.2 * 2 от первых попыток - один повтор.
+    with pytest.raises(Exception):
+        first.execute()
+    with pytest.raises(Exception):
+        second.execute()
+    assert (first.total_calls, second.total_calls) == (10, 2)
@@ -0,0 +1,105 @@
+"""Замеры самописных itertools.
+
+Запуск из папки 5_iterators:
+python bench.py [batched|chain]
+"""
+import itertools
+import sys
+import time
+from array import array
+
+from self_batched.self_batched import Batched, batched
+from self_chain.self_chain import Chain
+
+ITEMS_COUNT = 2_000_000
+REPEAT = 3
+BATCH_SIZE = 100
+
+
+def legacy_batched(obj, n):
+    """Прежняя реализация batched с поэлементным append - для сравнения."""
+    batch = []
+    for item in obj:
+        batch.append(item)
+        if len(batch) == n:
+            yield tuple(batch)
+            batch = []
+    if batch:
+        yield tuple(batch)
+
+
+class LegacyChain:
+    """Прежняя реализация Chain - для сравнения."""
+
+    def __init__(self, *iterables):
+        self.current_iterator = iter(iterables)
+        self.inner_iterator = iter(next(self.current_iterator))
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            return next(self.inner_iterator)
+        except StopIteration:
+            self.inner_iterator = iter(next(self.current_iterator))
+            return next(self.inner_iterator)
+
+
+def measure(func, *args) -> float:
+    start = time.perf_counter()
+    for _ in func(*args):
+        pass
+    return time.perf_counter() - start
+
+
+def bench_batched():
+    sources = {
+        'list': lambda: list(range(ITEMS_COUNT)),
+        'bytes': lambda: bytes(ITEMS_COUNT),
+        'array': lambda: array('q', range(ITEMS_COUNT)),
+        'generator': lambda: (item for item in range(ITEMS_COUNT)),
+    }
+    for name, make_source in sources.items():
+        legacy_time = measure(legacy_batched, make_source(), BATCH_SIZE)
+        generator_time = measure(batched, make_source(), BATCH_SIZE)
+        class_time = measure(Batched, make_source(), BATCH_SIZE)
+        print(
+            f'batched({name}, n={BATCH_SIZE}): legacy {legacy_time:.3f}s, '
+            f'generator {generator_time:.3f}s (x{legacy_time / generator_time:.1f}), '
+            f'class {class_time:.3f}s (x{legacy_time / class_time:.1f})'
+        )
+
+
+def best_of(func, make_sources) -> float:
+    """Лучшее время из REPEAT прогонов, чтобы разница между реализациями не тонула в шуме."""
+    return min(measure(func, *make_sources()) for _ in range(REPEAT))
+
+
+def bench_chain():
+    sources = {
+        'few long lists': lambda: [list(range(ITEMS_COUNT // 10))] * 10,
+        'many short lists': lambda: [[1, 2, 3]] * (ITEMS_COUNT // 3),
+        'single-item lists': lambda: [[1]] * ITEMS_COUNT,
+        # Прежняя реализация обрывается на пустом источнике посреди цепочки и теряет все, что идет после него.
+        'long lists between empty ones': lambda: [[], list(range(ITEMS_COUNT // 10))] * 10,
+    }
+    for name, make_sources in sources.items():
+        expected_count = sum(map(len, make_sources()))
+        itertools_time = best_of(itertools.chain, make_sources)
+        chain_time = best_of(Chain, make_sources)
+        assert sum(1 for _ in Chain(*make_sources())) == expected_count
+        line = f'chain({name}): itertools {itertools_time:.3f}s, Chain {chain_time:.3f}s'
+        if sum(1 for _ in LegacyChain(*make_sources())) == expected_count:
+            line += f', legacy {best_of(LegacyChain, make_sources):.3f}s'
+        else:
+            line += ', legacy loses items'
+        print(line)
+
+
+if __name__ == '__main__':
+    benches = sys.argv[1:] or ['batched', 'chain']
+    if 'batched' in benches:
+        bench_batched()
+    if 'chain' in benches:
+        bench_chain()
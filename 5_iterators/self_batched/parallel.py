@@ -0,0 +1,65 @@
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from typing import Callable, Generator, Iterable, TypeVar
+
+from .self_batched import _check_n, batched
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def map_batches(
+    func: Callable[[tuple[T, ...]], R],
+    iterable: Iterable[T],
+    n: int,
+    executor: Executor,
+    max_in_flight: int = 4,
+    ordered: bool = True,
+) -> Generator[R, None, None]:
+    """Режет iterable на пачки по n элементов и обрабатывает их func в executor (пуле потоков или процессов).
+
+    Одновременно в обработке не больше max_in_flight пачек: следующая пачка читается из iterable только после того,
+    как потребитель забрал результат, поэтому память ограничена примерно n * max_in_flight элементами.
+    При ordered=True результаты отдаются в порядке пачек, иначе - по мере готовности.
+    Исключение из func выбрасывается потребителю, необработанные пачки при этом отменяются.
+    """
+    # Оба аргумента проверяются сразу, а не при первом next: batched - генератор и проверит n слишком поздно.
+    _check_n(n)
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight должен быть больше или равен 1")
+
+    if ordered:
+        return _map_ordered(func, batched(iterable, n), executor, max_in_flight)
+    return _map_unordered(func, batched(iterable, n), executor, max_in_flight)
+
+
+def _map_ordered(func, batches, executor: Executor, max_in_flight: int):
+    pending: deque[Future] = deque()
+    try:
+        for batch in batches:
+            if len(pending) >= max_in_flight:
+                yield pending.popleft().result()
+            pending.append(executor.submit(func, batch))
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _map_unordered(func, batches, executor: Executor, max_in_flight: int):
+    pending: set[Future] = set()
+    try:
+        for batch in batches:
+            if len(pending) >= max_in_flight:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+            pending.add(executor.submit(func, batch))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
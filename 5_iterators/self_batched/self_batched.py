@@ -1,11 +1,82 @@
-from typing import Generator, Iterable, TypeVar
+import asyncio
+from array import array
+from itertools import islice
+from typing import AsyncGenerator, AsyncIterable, Generator, Iterable, TypeVar
 
 T = TypeVar("T")
 
+# Типы, у которых срез копируется целиком на уровне C, без поэлементного обхода в python.
+SLICEABLE_TYPES = (list, tuple, str, bytes, bytearray, range, array, memoryview)
+
+
+def _is_sliceable(obj) -> bool:
+    return isinstance(obj, SLICEABLE_TYPES) and (not isinstance(obj, memoryview) or obj.ndim == 1)
+
+
+def _check_n(n: int):
+    if n < 1:
+        raise ValueError("n должен быть больше или равен 1")
+
 
 def batched(obj: Iterable[T], n: int) -> Generator[tuple[T], None, None]:
+    _check_n(n)
+    if _is_sliceable(obj):
+        for start in range(0, len(obj), n):
+            yield tuple(obj[start:start + n])
+        return
+
+    iterator = iter(obj)
+    while batch := tuple(islice(iterator, n)):
+        yield batch
+
+
+def batched_buffer(obj: bytes | bytearray | memoryview | array, n: int) -> Generator[memoryview, None, None]:
+    """Как batched, но для буферов отдает memoryview-окна без копирования данных."""
+    _check_n(n)
+    view = memoryview(obj)
+    for start in range(0, len(view), n):
+        yield view[start:start + n]
+
+
+class Batched:
+    def __init__(self, obj: Iterable[T], n: int):
+        _check_n(n)
+        self.obj = obj
+        self.n = n
+        self.position = 0
+        self.iterator = None if _is_sliceable(obj) else iter(obj)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.iterator is None:
+            start = self.position
+            if start >= len(self.obj):
+                raise StopIteration
+            self.position = start + self.n
+            return tuple(self.obj[start:self.position])
+
+        batch = tuple(islice(self.iterator, self.n))
+        if not batch:
+            raise StopIteration
+        return batch
+
+
+async def abatched(obj: AsyncIterable[T], n: int, max_wait: float | None = None) -> AsyncGenerator[tuple[T], None]:
+    """Асинхронный batched. С max_wait неполная пачка отдается, если с ее первого элемента прошло max_wait секунд."""
+    _check_n(n)
+    if max_wait is not None:
+        batches = ABatched(obj, n, max_wait)
+        try:
+            async for batch in batches:
+                yield batch
+        finally:
+            await batches.aclose()
+        return
+
     batch = []
-    for item in obj:
+    async for item in obj:
         batch.append(item)
         if len(batch) == n:
             yield tuple(batch)
@@ -14,26 +85,55 @@ def batched(obj: Iterable[T], n: int) -> Generator[tuple[T], None, None]:
         yield tuple(batch)
 
 
-class Batched:
-    def __init__(self, obj: Iterable[T], n: int):
+class ABatched:
+    def __init__(self, obj: AsyncIterable[T], n: int, max_wait: float | None = None):
+        _check_n(n)
         self.obj = obj
         self.n = n
-        self.iterator = iter(obj)
-        self.batch = []
+        self.max_wait = max_wait
+        self.iterator = obj.__aiter__()
+        self.exhausted = False
+        # Запрос следующего элемента, не дождавшийся конца max_wait, переходит в следующую пачку, а не отменяется:
+        # отмена закрыла бы асинхронный генератор-источник.
+        self.pending: asyncio.Future | None = None
 
-    def __iter__(self):
+    def __aiter__(self):
         return self
 
-    def __next__(self):
-        while len(self.batch) < self.n:
+    async def __anext__(self) -> tuple[T]:
+        batch = []
+        deadline = None
+        loop = asyncio.get_running_loop()
+
+        while len(batch) < self.n and not self.exhausted:
+            if self.max_wait is None:
+                try:
+                    batch.append(await self.iterator.__anext__())
+                except StopAsyncIteration:
+                    self.exhausted = True
+                continue
+
+            if self.pending is None:
+                self.pending = asyncio.ensure_future(self.iterator.__anext__())
+            timeout = None if deadline is None else max(deadline - loop.time(), 0)
+            done, _ = await asyncio.wait({self.pending}, timeout=timeout)
+            if not done:
+                break
+
+            future, self.pending = self.pending, None
             try:
-                self.batch.append(next(self.iterator))
-            except StopIteration:
-                if self.batch:
-                    result = tuple(self.batch)
-                    self.batch = []
-                    return result
-                raise StopIteration
-        result = tuple(self.batch)
-        self.batch = []
-        return result
+                batch.append(future.result())
+            except StopAsyncIteration:
+                self.exhausted = True
+            if deadline is None:
+                deadline = loop.time() + self.max_wait
+
+        if not batch:
+            raise StopAsyncIteration
+        return tuple(batch)
+
+    async def aclose(self):
+        """Отменяет незавершенный запрос к источнику, если пачки перестали читать до его исчерпания."""
+        if self.pending is not None:
+            self.pending.cancel()
+            self.pending = None
@@ -0,0 +1,67 @@
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from .parallel import map_batches
+
+
+def counting_source(count: int, pulled: list[int]):
+    for item in range(count):
+        pulled[0] += 1
+        yield item
+
+
+@pytest.mark.parametrize("ordered", (True, False))
+@pytest.mark.parametrize("executor_cls", (ThreadPoolExecutor, ProcessPoolExecutor))
+def test_map_batches(executor_cls, ordered):
+    with executor_cls(max_workers=2) as executor:
+        result = list(map_batches(sum, range(100), 7, executor, max_in_flight=3, ordered=ordered))
+
+    expected = [sum(range(start, min(start + 7, 100))) for start in range(0, 100, 7)]
+    if not ordered:
+        result, expected = sorted(result), sorted(expected)
+    assert result == expected
+
+
+def test_map_batches_ordered_with_uneven_work():
+    def slow_first(batch):
+        if batch[0] == 0:
+            time.sleep(0.1)
+        return batch
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        ordered = list(map_batches(slow_first, range(8), 2, executor, max_in_flight=4))
+        unordered = list(map_batches(slow_first, range(8), 2, executor, max_in_flight=4, ordered=False))
+
+    assert ordered == [(0, 1), (2, 3), (4, 5), (6, 7)]
+    assert unordered[-1] == (0, 1)
+
+
+@pytest.mark.parametrize("ordered", (True, False))
+def test_map_batches_backpressure(ordered):
+    pulled = [0]
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = map_batches(list, counting_source(1000, pulled), 10, executor, max_in_flight=3, ordered=ordered)
+        next(results)
+        assert pulled[0] <= 10 * 4
+        results.close()
+
+
+@pytest.mark.parametrize("ordered", (True, False))
+def test_map_batches_error(ordered):
+    def fail_on_second(batch):
+        if batch[0] == 2:
+            raise RuntimeError("boom")
+        return batch
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        with pytest.raises(RuntimeError, match="boom"):
+            list(map_batches(fail_on_second, range(100), 2, executor, max_in_flight=2, ordered=ordered))
+
+
+@pytest.mark.parametrize("n, max_in_flight", ((2, 0), (0, 2)))
+def test_map_batches_invalid_arguments(n, max_in_flight):
+    with ThreadPoolExecutor() as executor:
+        with pytest.raises(ValueError):
+            map_batches(list, range(10), n, executor, max_in_flight=max_in_flight)
@@ -1,8 +1,21 @@
+import asyncio
+from array import array
 from itertools import batched as real_batched
 
 import pytest
 
-from .self_batched import Batched, batched
+from .self_batched import ABatched, Batched, abatched, batched, batched_buffer
+
+SOURCES = (
+    lambda: b"abcdefg",
+    lambda: bytearray(b"abcdefg"),
+    lambda: memoryview(b"abcdefg"),
+    lambda: array("i", range(10)),
+    lambda: range(10),
+    lambda: (item for item in range(10)),
+    lambda: {1: 1, 2: 2, 3: 3},
+    lambda: [],
+)
 
 
 class TestGeneratorBatched:
@@ -49,3 +62,52 @@ class TestClassBatched:
 
         for idx, (rb_element, b_element) in enumerate(zip(rb, b)):
             assert b_element == rb_element
+
+
+@pytest.mark.parametrize("make_source", SOURCES)
+@pytest.mark.parametrize("n", (1, 3, 100))
+@pytest.mark.parametrize("batched_impl", (batched, Batched))
+def test_fast_path_matches_itertools(make_source, n, batched_impl):
+    assert list(batched_impl(make_source(), n)) == list(real_batched(make_source(), n))
+
+
+@pytest.mark.parametrize("batched_impl", (lambda obj, n: list(batched(obj, n)), Batched, batched_buffer))
+def test_invalid_n(batched_impl):
+    with pytest.raises(ValueError):
+        list(batched_impl(b"abc", 0))
+
+
+def test_batched_buffer_windows_without_copy():
+    data = bytearray(b"abcdefg")
+    windows = list(batched_buffer(data, 3))
+    assert [bytes(window) for window in windows] == [b"abc", b"def", b"g"]
+
+    data[0] = ord("z")
+    assert bytes(windows[0]) == b"zbc"
+
+
+async def agenerate(items, delays=None):
+    for idx, item in enumerate(items):
+        if delays:
+            await asyncio.sleep(delays[idx])
+        yield item
+
+
+async def acollect(aiterable):
+    return [item async for item in aiterable]
+
+
+@pytest.mark.parametrize("batched_impl", (abatched, ABatched))
+@pytest.mark.parametrize("max_wait", (None, 10))
+@pytest.mark.parametrize("iterable, n", (("ABCDEFG", 3), ([1, 2, 3, 4, 5, 6], 2), ([], 4)))
+def test_async_batched(batched_impl, max_wait, iterable, n):
+    result = asyncio.run(acollect(batched_impl(agenerate(iterable), n, max_wait=max_wait)))
+    assert result == list(real_batched(iterable, n))
+
+
+@pytest.mark.parametrize("batched_impl", (abatched, ABatched))
+def test_async_batched_flushes_after_max_wait(batched_impl):
+    # После второго элемента источник надолго замолкает - неполная пачка должна уйти по таймауту.
+    source = agenerate([1, 2, 3, 4, 5], delays=[0, 0, 0.3, 0, 0])
+    result = asyncio.run(acollect(batched_impl(source, 3, max_wait=0.1)))
+    assert result == [(1, 2), (3, 4, 5)]
@@ -1,4 +1,4 @@
-from typing import Generator, Iterable, TypeVar
+from typing import AsyncGenerator, AsyncIterable, Generator, Iterable, TypeVar
 
 T = TypeVar("T")
 
@@ -10,20 +10,62 @@ def chain(*iterables: Iterable[T]) -> Generator[T, None, None]:
 
 
 class Chain:
+    """Итератор по элементам нескольких источников подряд.
+
+    Источники берутся лениво, по одному: from_iterable принимает их из любого итератора, например генератора,
+    открывающего файлы. Элемент текущего источника берется одним next; при переходе к следующему источнику
+    первый элемент достается циклом for, поэтому пустые источники пропускаются без исключений и без рекурсии.
+    """
+
     def __init__(self, *iterables: Iterable[T]):
-        self.iterables = iterables
-        self.current_iterator = iter(self.iterables)
-        self.inner_iterator = iter(next(self.current_iterator))
+        self.sources = iter(iterables)
+        self.current = iter(())
+
+    @classmethod
+    def from_iterable(cls, iterables: Iterable[Iterable[T]]) -> "Chain":
+        chain = cls()
+        chain.sources = iter(iterables)
+        return chain
 
     def __iter__(self):
         return self
 
-    def __next__(self):
+    def __next__(self) -> T:
         try:
-            return next(self.inner_iterator)
+            return next(self.current)
         except StopIteration:
+            pass
+
+        for source in self.sources:
+            current = iter(source)
+            for item in current:
+                self.current = current
+                return item
+        raise StopIteration
+
+
+async def achain(*iterables: AsyncIterable[T]) -> AsyncGenerator[T, None]:
+    for it in iterables:
+        async for item in it:
+            yield item
+
+
+class AChain:
+    def __init__(self, *iterables: AsyncIterable[T]):
+        self.iterables = iter(iterables)
+        self.inner_iterator = None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> T:
+        while True:
+            if self.inner_iterator is None:
+                try:
+                    self.inner_iterator = next(self.iterables).__aiter__()
+                except StopIteration:
+                    raise StopAsyncIteration from None
             try:
-                self.inner_iterator = iter(next(self.current_iterator))
-                return next(self.inner_iterator)
-            except StopIteration:
-                raise StopIteration
+                return await self.inner_iterator.__anext__()
+            except StopAsyncIteration:
+                self.inner_iterator = None
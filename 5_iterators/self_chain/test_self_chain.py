@@ -1,9 +1,10 @@
+import asyncio
 from itertools import chain as real_chain
 from typing import Iterable
 
 import pytest
 
-from .self_chain import Chain, chain
+from .self_chain import AChain, Chain, achain, chain
 
 
 class TestGeneratorChain:
@@ -36,3 +37,56 @@ class TestClassChain:
 
         for idx, (rc_element, c_element) in enumerate(zip(rc, c)):
             assert rc_element == c_element
+
+
+async def agenerate(items):
+    for item in items:
+        yield item
+
+
+async def acollect(aiterable):
+    return [item async for item in aiterable]
+
+
+@pytest.mark.parametrize("chain_impl", (achain, AChain))
+@pytest.mark.parametrize(
+    "iterable_objects",
+    [
+        ["1234", [1, 2, 3, 4], ["a", "b", 1], {1: 1, 2: 2}],
+        ["1234", []],
+        [[], [], "12", [], []],
+        [],
+    ]
+)
+def test_async_chain(chain_impl, iterable_objects: list[Iterable]):
+    result = asyncio.run(acollect(chain_impl(*map(agenerate, iterable_objects))))
+    assert result == list(real_chain(*iterable_objects))
+
+
+class TestChainFromIterable:
+    def test_lazy_sources(self):
+        opened = []
+
+        def sources():
+            for idx in range(3):
+                opened.append(idx)
+                yield [idx] * idx
+
+        c = Chain.from_iterable(sources())
+        assert opened == []
+        assert next(c) == 1
+        assert opened == [0, 1]
+        assert list(c) == [2, 2]
+
+    def test_many_empty_sources(self):
+        c = Chain.from_iterable([[] for _ in range(100_000)] + [[1]] + [[] for _ in range(100_000)])
+        assert list(c) == [1]
+
+    def test_without_arguments(self):
+        assert list(Chain()) == []
+
+    def test_exhausted_chain_stays_exhausted(self):
+        c = Chain([1])
+        assert list(c) == [1]
+        with pytest.raises(StopIteration):
+            next(c)
@@ -1,9 +1,24 @@
-from typing import Generator, Iterable, TypeVar, Iterator
+from collections.abc import Sequence
+from functools import partial
+from typing import AsyncGenerator, AsyncIterable, Callable, Generator, Iterable, Iterator, TypeVar
 
 T = TypeVar("T")
 
 
+def read_lines(path: str, encoding: str = "utf-8") -> Generator[str, None, None]:
+    with open(path, "r", encoding=encoding) as file:
+        for line in file:
+            yield line
+
+
 def cycle(obj: Iterable[T]) -> Generator[T, None, None]:
+    # Последовательность можно просто обходить заново, копировать ее элементы не нужно.
+    if isinstance(obj, Sequence):
+        while obj:
+            for item in obj:
+                yield item
+        return
+
     saved = []
     for item in obj:
         yield item
@@ -14,17 +29,89 @@ def cycle(obj: Iterable[T]) -> Generator[T, None, None]:
 
 
 class Cycle:
-    def __init__(self, iterable: Iterable[T]):
+    """Ленивый cycle.
+
+    Если источник можно обойти заново (последовательность, файл через from_path или функция-фабрика через
+    from_factory), то на каждом круге он обходится заново и элементы не сохраняются, поэтому память не зависит от
+    размера источника. Остальные итерируемые объекты, как и в itertools.cycle, сохраняются по мере первого обхода.
+    """
+
+    def __init__(self, iterable: Iterable[T], factory: Callable[[], Iterable[T]] | None = None):
+        if factory is None and isinstance(iterable, Sequence):
+            factory = partial(iter, iterable)
         self.iterable = iterable
-        self.saved = list(iterable)  
-        self.iterator = iter(self.saved)
+        self.factory = factory
+        self.iterator = iter(iterable)
+        self.saved = []
+        self.caching = factory is None
+        self.round_has_items = False
+
+    @classmethod
+    def from_factory(cls, factory: Callable[[], Iterable[T]]) -> "Cycle":
+        """factory вызывается в начале каждого круга и должна каждый раз возвращать источник заново."""
+        return cls(factory(), factory)
+
+    @classmethod
+    def from_path(cls, path: str, encoding: str = "utf-8") -> "Cycle":
+        """Циклически отдает строки файла, открывая его заново на каждом круге."""
+        return cls.from_factory(partial(read_lines, path, encoding))
 
     def __iter__(self) -> Iterator[T]:
         return self
 
     def __next__(self) -> T:
-        try:
-            return next(self.iterator)
-        except StopIteration:
-            self.iterator = iter(self.saved)
-            return next(self.iterator)
\ No newline at end of file
+        # Второй проход нужен, когда текущий круг закончился и надо начать следующий.
+        for _ in range(2):
+            try:
+                item = next(self.iterator)
+            except StopIteration:
+                if not self.round_has_items:
+                    raise
+                self.round_has_items = False
+                self.caching = False
+                self.iterator = iter(self.saved if self.factory is None else self.factory())
+                continue
+
+            self.round_has_items = True
+            if self.caching:
+                self.saved.append(item)
+            return item
+
+        raise StopIteration
+
+
+async def acycle(obj: AsyncIterable[T]) -> AsyncGenerator[T, None]:
+    saved = []
+    async for item in obj:
+        yield item
+        saved.append(item)
+    while saved:
+        for item in saved:
+            yield item
+
+
+class ACycle:
+    def __init__(self, iterable: AsyncIterable[T]):
+        self.iterable = iterable
+        self.iterator = iterable.__aiter__()
+        self.saved = []
+        self.index = 0
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> T:
+        if self.iterator is not None:
+            try:
+                item = await self.iterator.__anext__()
+            except StopAsyncIteration:
+                self.iterator = None
+            else:
+                self.saved.append(item)
+                return item
+
+        if not self.saved:
+            raise StopAsyncIteration
+        item = self.saved[self.index]
+        self.index = (self.index + 1) % len(self.saved)
+        return item
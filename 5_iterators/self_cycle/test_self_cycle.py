@@ -1,10 +1,11 @@
+import asyncio
 from itertools import cycle as real_cycle
-from itertools import zip_longest
+from itertools import count, islice, zip_longest
 from typing import Iterable
 
 import pytest
 
-from .self_cycle import Cycle, cycle
+from .self_cycle import ACycle, Cycle, acycle, cycle
 
 
 class TestGeneratorCycle:
@@ -49,3 +50,58 @@ class TestClassCycle:
             assert rc_element == c_element
             if idx == stop_idx:
                 break
+
+
+async def agenerate(items):
+    for item in items:
+        yield item
+
+
+async def atake(aiterable, count: int):
+    result = []
+    async for item in aiterable:
+        result.append(item)
+        if len(result) == count:
+            break
+    return result
+
+
+@pytest.mark.parametrize("cycle_impl", (acycle, ACycle))
+@pytest.mark.parametrize("iterable_object", ["1234", [1, 2, 3, 4], {1, 2, 3, 4}, [7], []])
+def test_async_cycle(cycle_impl, iterable_object: Iterable):
+    result = asyncio.run(atake(cycle_impl(agenerate(iterable_object)), 100))
+    assert result == list(islice(real_cycle(iterable_object), 100))
+
+
+class TestLazyCycle:
+    def test_does_not_consume_source_eagerly(self):
+        c = Cycle(count())
+        assert list(islice(c, 5)) == [0, 1, 2, 3, 4]
+
+    def test_sequence_is_not_cached(self):
+        c = Cycle([1, 2, 3])
+        assert list(islice(c, 7)) == [1, 2, 3, 1, 2, 3, 1]
+        assert c.saved == []
+
+    def test_from_factory(self):
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return (item for item in "ab")
+
+        c = Cycle.from_factory(factory)
+        assert list(islice(c, 5)) == ["a", "b", "a", "b", "a"]
+        assert len(calls) == 3
+        assert c.saved == []
+
+    def test_from_path(self, tmp_path):
+        path = tmp_path / "lines.txt"
+        path.write_text("first\nsecond\n", encoding="utf-8")
+        c = Cycle.from_path(str(path))
+        assert list(islice(c, 5)) == ["first\n", "second\n", "first\n", "second\n", "first\n"]
+
+    @pytest.mark.parametrize("make_cycle", (Cycle, cycle, lambda items: Cycle.from_factory(lambda: iter(items))))
+    def test_empty_source(self, make_cycle):
+        assert list(make_cycle([])) == []
+        assert list(make_cycle(iter([]))) == []